@@ -0,0 +1,244 @@
+"""
+Persistent amlt worker process.
+
+Every `amlt` invocation pays interpreter start-up, imports and auth before doing any
+work. The worker loads amlt's console entry point once, in the interpreter amlt is
+installed in, and runs each command it receives in-process.
+Enabled with FSC_AMLT_DAEMON=1; AmltParser falls back to plain subprocesses whenever
+the worker is disabled or unavailable.
+
+Protocol: one JSON object per line. The worker first replies {"ready": bool}, then
+answers each {"cmd": [...]} request with {"rc": int, "stdout": str, "stderr": str}.
+
+This file is also the worker script itself, so it must only import the stdlib.
+"""
+
+import atexit
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import traceback
+from typing import List, Optional, Tuple
+
+ENV_FLAG = "FSC_AMLT_DAEMON"
+STARTUP_TIMEOUT = 60  # seconds to load amlt in the worker
+
+
+def _amlt_interpreter() -> Optional[List[str]]:
+    """Command prefix of the Python interpreter amlt runs under, from its script's shebang."""
+    path = shutil.which('amlt')
+    if not path:
+        return None
+    try:
+        with open(path, 'rb') as f:
+            first_line = f.readline().decode('utf-8', errors='replace').strip()
+    except OSError:
+        return None
+    if not first_line.startswith('#!') or 'python' not in first_line:
+        return None
+    return first_line[2:].split()
+
+
+class AmltDaemon:
+    """Client for the worker process; calls are serialized over one pipe."""
+
+    def __init__(self):
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self._broken = False  # worker could not load amlt; stop trying
+
+    def run(self, cmd: List[str], timeout: int = 60) -> Optional[Tuple[bool, str, str]]:
+        """
+        Run an amlt command in the worker and return (success, stdout, stderr).
+        Returns None if the worker is unavailable, so the caller can fall back.
+        """
+        with self._lock:
+            if self._broken:
+                return None
+            if (self._proc is None or self._proc.poll() is not None) and not self._start():
+                self._broken = True
+                return None
+
+            reply = self._request({'cmd': cmd}, timeout)
+            if reply is None:
+                if self._broken:
+                    return None
+                return False, "", f"Command timed out after {timeout}s"
+            return reply.get('rc') == 0, reply.get('stdout', ''), reply.get('stderr', '')
+
+    def close(self):
+        """Stop the worker."""
+        with self._lock:
+            self._stop()
+
+    def _start(self) -> bool:
+        interpreter = _amlt_interpreter()
+        if interpreter is None:
+            return False
+        try:
+            self._proc = subprocess.Popen(
+                interpreter + [os.path.abspath(__file__)],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                text=True, bufsize=1,
+            )
+        except Exception:
+            self._proc = None
+            return False
+
+        handshake = self._read_reply(STARTUP_TIMEOUT)
+        if not handshake or not handshake.get('ready'):
+            self._stop()
+            return False
+        return True
+
+    def _request(self, payload: dict, timeout: int) -> Optional[dict]:
+        try:
+            self._proc.stdin.write(json.dumps(payload) + "\n")
+            self._proc.stdin.flush()
+        except (OSError, ValueError):
+            self._stop()
+            self._broken = True
+            return None
+        return self._read_reply(timeout)
+
+    def _read_reply(self, timeout: int) -> Optional[dict]:
+        """Read one reply line; on timeout or a dead worker, stop it and return None."""
+        timed_out = threading.Event()
+
+        def kill():
+            timed_out.set()
+            self._proc.kill()
+
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+        try:
+            line = self._proc.stdout.readline()
+        except (OSError, ValueError):
+            line = ""
+        finally:
+            timer.cancel()
+
+        try:
+            reply = json.loads(line) if line else None
+        except ValueError:
+            reply = None
+        if reply is None:
+            self._stop()
+            if not timed_out.is_set():
+                # The worker died rather than timing out; treat it as unusable
+                self._broken = True
+        return reply
+
+    def _stop(self):
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=2)
+        except Exception:
+            proc.kill()
+            proc.wait()
+
+
+_daemon: Optional[AmltDaemon] = None
+_daemon_lock = threading.Lock()
+
+
+def get_amlt_daemon() -> Optional[AmltDaemon]:
+    """Get the shared worker client, or None unless FSC_AMLT_DAEMON=1."""
+    global _daemon
+    if os.environ.get(ENV_FLAG) != "1":
+        return None
+    with _daemon_lock:
+        if _daemon is None:
+            _daemon = AmltDaemon()
+            atexit.register(_daemon.close)
+    return _daemon
+
+
+# --- Worker side (runs in amlt's interpreter) ---
+
+def _load_amlt_main():
+    """Load the function behind the `amlt` console script."""
+    from importlib.metadata import entry_points
+
+    eps = entry_points()
+    scripts = eps.select(group='console_scripts') if hasattr(eps, 'select') else eps.get('console_scripts', [])
+    for ep in scripts:
+        if ep.name == 'amlt':
+            return ep.load()
+    return None
+
+
+def _run_captured(main, cmd: List[str]) -> Tuple[int, str, str]:
+    """Run main() with argv=cmd, capturing fds 1 and 2 so writes from any library land too."""
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        saved = os.dup(1), os.dup(2)
+        os.dup2(out.fileno(), 1)
+        os.dup2(err.fileno(), 2)
+        sys.argv = ['amlt'] + list(cmd[1:])
+        rc = 0
+        try:
+            result = main()
+            rc = result if isinstance(result, int) else 0
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                rc = e.code or 0
+            else:
+                rc = 1
+                print(e.code, file=sys.stderr)
+        except Exception:
+            rc = 1
+            traceback.print_exc()
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(saved[0], 1)
+            os.dup2(saved[1], 2)
+            os.close(saved[0])
+            os.close(saved[1])
+
+        out.seek(0)
+        err.seek(0)
+        return (
+            rc,
+            out.read().decode('utf-8', errors='replace'),
+            err.read().decode('utf-8', errors='replace'),
+        )
+
+
+def _worker_main():
+    # Keep the protocol on private fds; commands see /dev/null as stdin so a prompt
+    # can't swallow requests
+    requests = os.fdopen(os.dup(0), 'r')
+    replies = os.fdopen(os.dup(1), 'w', buffering=1)
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.close(devnull)
+
+    try:
+        main = _load_amlt_main()
+    except Exception:
+        main = None
+    replies.write(json.dumps({'ready': main is not None}) + "\n")
+    if main is None:
+        return
+
+    for line in requests:
+        try:
+            cmd = json.loads(line)['cmd']
+        except (ValueError, KeyError, TypeError):
+            continue
+        rc, stdout, stderr = _run_captured(main, cmd)
+        replies.write(json.dumps({'rc': rc, 'stdout': stdout, 'stderr': stderr}) + "\n")
+
+
+if __name__ == '__main__':
+    _worker_main()
@@ -5,11 +5,20 @@ Parses the output of `amlt list` and `amlt status` commands.
 
 import re
 import subprocess
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import List, Optional, Tuple
 import shlex
 
+from .amlt_daemon import get_amlt_daemon
+from .utils import parse_time_ago
+
+# Bounds for fanning out `amlt status` calls, shared by the sync service and the TUI
+STATUS_WORKERS = 4  # concurrent calls per fan-out
+STATUS_RATE = 2  # calls started per second, on average, across the process
+
 
 @dataclass
 class ExperimentInfo:
@@ -89,7 +98,15 @@ class AmltParser:
     def run_amlt_command(cmd: List[str], timeout: int = 60) -> Tuple[bool, str, str]:
         """
         Run an amlt command and return (success, stdout, stderr).
+        Uses the persistent amlt worker when enabled (FSC_AMLT_DAEMON=1).
         """
+        if cmd and cmd[0] == 'amlt':
+            daemon = get_amlt_daemon()
+            if daemon is not None:
+                result = daemon.run(cmd, timeout)
+                if result is not None:
+                    return result
+        
         try:
             result = subprocess.run(
                 cmd,
@@ -335,15 +352,23 @@ class AmltParser:
         )
 
 
-def get_experiments(n_recent: int = 50) -> List[ExperimentInfo]:
-    """Get list of recent experiments."""
+def get_experiments(n_recent: int = 50, since: Optional[float] = None) -> List[ExperimentInfo]:
+    """
+    Get list of recent experiments.
+    If since (a Unix timestamp) is given, only experiments modified at or after it are
+    returned; `amlt list` can't filter by time, so this is done on the parsed rows.
+    """
     parser = AmltParser()
     success, stdout, stderr = parser.run_amlt_command(
         ['amlt', 'list', '--most-recent', str(n_recent)]
     )
-    if success:
-        return parser.parse_list_output(stdout)
-    return []
+    if not success:
+        return []
+    experiments = parser.parse_list_output(stdout)
+    if since is not None:
+        now = time.time()
+        experiments = [e for e in experiments if now - parse_time_ago(e.modified) * 60 >= since]
+    return experiments
 
 
 def get_experiment_status(exp_name: str) -> Optional[ExperimentDetail]:
@@ -355,3 +380,35 @@ def get_experiment_status(exp_name: str) -> Optional[ExperimentDetail]:
     if success:
         return parser.parse_status_output(stdout)
     return None
+
+
+class RateLimiter:
+    """
+    Caps the average rate of calls to max_per_sec without a fixed sleep after each one:
+    a call only waits if it would come sooner than 1/max_per_sec after the previous slot.
+    Thread-safe.
+    """
+    
+    def __init__(self, max_per_sec: float = 2):
+        self._interval = 1.0 / max_per_sec
+        self._next_time = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until the next call slot."""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_time - now
+            self._next_time = max(now, self._next_time) + self._interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+# One limiter for the whole process, so concurrent fan-outs share the rate
+STATUS_LIMITER = RateLimiter(STATUS_RATE)
+
+
+def get_experiment_status_limited(exp_name: str) -> Optional[ExperimentDetail]:
+    """get_experiment_status, within the process-wide STATUS_LIMITER rate."""
+    STATUS_LIMITER.acquire()
+    return get_experiment_status(exp_name)
@@ -92,6 +92,22 @@ class CachedExperimentDetail:
         data = dict(data)
         data['jobs'] = jobs
         return cls(**data)
+    
+    def job_data(self) -> List[Any]:
+        """
+        Get the cached jobs as JobData, built once and reused on later cache hits.
+        The objects are shared between views: replace them (JobData.with_status), don't mutate.
+        """
+        job_data = getattr(self, '_job_data', None)
+        if job_data is None:
+            from .data import JobData
+            # Positional args follow JobData's field order
+            job_data = [
+                JobData(j.index, j.name, j.status, j.duration, j.size, j.submitted, j.flags, j.portal_url)
+                for j in self.jobs
+            ]
+            self._job_data = job_data
+        return job_data
 
 
 class ExperimentCache:
@@ -142,6 +158,10 @@ class ExperimentCache:
         """Get all cached experiments."""
         return list(self._cache.values())
     
+    def get_except(self, names: Set[str]) -> List[CachedExperiment]:
+        """Get all cached experiments not in names."""
+        return [exp for name, exp in self._cache.items() if name not in names]
+    
     def get_by_status(self, status: str) -> List[CachedExperiment]:
         """Get cached experiments by status."""
         return [exp for exp in self._cache.values() if exp.status == status]
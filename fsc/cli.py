@@ -7,11 +7,10 @@ import sys
 import time
 import signal
 import threading
-from datetime import datetime
 from typing import Optional
 
 import click
-from rich.console import Console
+from rich.console import Console, Group
 from rich.prompt import Prompt, Confirm
 from rich.live import Live
 from rich.table import Table
@@ -21,8 +20,8 @@ from .models import Experiment, Job, SyncLog, init_database, close_database, dat
 from .sync import SyncService, start_sync_service, stop_sync_service, get_sync_service
 from .ui import (
     console, print_header, print_experiments, print_experiment_detail,
-    print_status_bar, clear_screen, create_experiments_table,
-    create_summary_panel, STATUS_COLORS
+    create_header, create_status_bar, create_experiments_table,
+    create_summary_panel, create_live_console, STATUS_COLORS
 )
 from .amlt_parser import get_experiments, get_experiment_status
 
@@ -88,10 +87,7 @@ def list_experiments(limit, status, compact, no_sync, refresh):
     query = Experiment.select().order_by(Experiment.updated_at.desc())
     
     if status != 'all':
-        if status == 'queued':
-            query = query.where(Experiment.status.in_(['queued', 'prep']))
-        else:
-            query = query.where(Experiment.status == status)
+        query = query.where(Experiment.status_normalized == status)
     
     experiments = list(query.limit(limit))
     
@@ -109,7 +105,8 @@ def list_experiments(limit, status, compact, no_sync, refresh):
 @main.command('status', help='Show detailed status of an experiment')
 @click.argument('experiment_name')
 @click.option('--refresh', '-r', is_flag=True, help='Force refresh from AMLT')
-def show_status(experiment_name, refresh):
+@click.option('--no-jobs', is_flag=True, help='Show only the experiment summary, without the jobs table')
+def show_status(experiment_name, refresh, no_jobs):
     """Show detailed status of an experiment."""
     init_database()
     
@@ -132,7 +129,7 @@ def show_status(experiment_name, refresh):
             return
     
     print_header()
-    print_experiment_detail(exp)
+    print_experiment_detail(exp, include_jobs=not no_jobs)
     
     close_database()
 
@@ -188,38 +185,43 @@ def watch_experiments(interval, limit, status):
     console.print("[cyan]Starting watch mode. Press Ctrl+C to exit.[/]")
     console.print(f"[dim]Refresh interval: {interval}s[/]\n")
     
+    # Terminal writes happen on a background thread, so a slow terminal can't stall the loop
+    live_console = create_live_console()
     try:
-        while not _should_exit:
-            # Sync
-            sync.sync_list(n_recent=limit)
-            last_sync = datetime.now()
-            
-            # Query
-            query = Experiment.select().order_by(Experiment.updated_at.desc())
-            if status != 'all':
-                if status == 'queued':
-                    query = query.where(Experiment.status.in_(['queued', 'prep']))
-                else:
-                    query = query.where(Experiment.status == status)
-            
-            experiments = list(query.limit(limit))
-            
-            # Display
-            clear_screen()
-            print_header()
-            print_experiments(experiments, show_summary=True, compact=True)
-            console.print()
-            print_status_bar(last_sync, sync_interval=interval)
-            
-            # Wait
-            for _ in range(interval):
-                if _should_exit:
-                    break
-                time.sleep(1)
+        with Live(console=live_console, refresh_per_second=4, screen=True) as live:
+            while not _should_exit:
+                # Sync
+                sync.sync_list(n_recent=limit)
+                last_sync = time.monotonic()
+                
+                # Query
+                query = Experiment.select().order_by(Experiment.updated_at.desc())
+                if status != 'all':
+                    query = query.where(Experiment.status_normalized == status)
+                
+                experiments = list(query.limit(limit))
+                
+                # Display - redraw in place instead of clearing the terminal
+                renderables = [create_header(), ""]
+                if experiments:
+                    renderables.extend([create_summary_panel(experiments), ""])
+                renderables.extend([
+                    create_experiments_table(experiments, compact=True),
+                    "",
+                    create_status_bar(last_sync, sync_interval=interval),
+                ])
+                live.update(Group(*renderables))
+                
+                # Wait
+                for _ in range(interval):
+                    if _should_exit:
+                        break
+                    time.sleep(1)
     
     except KeyboardInterrupt:
         pass
     finally:
+        live_console.file.drain()
         close_database()
         console.print("\n[cyan]Watch mode ended.[/]")
 
@@ -336,10 +338,10 @@ def show_stats():
         return
     
     stats = {
-        'pass': Experiment.select().where(Experiment.status == 'pass').count(),
-        'running': Experiment.select().where(Experiment.status == 'running').count(),
-        'queued': Experiment.select().where(Experiment.status.in_(['queued', 'prep'])).count(),
-        'fail': Experiment.select().where(Experiment.status.in_(['fail', 'failed'])).count(),
+        'pass': Experiment.select().where(Experiment.status_normalized == 'pass').count(),
+        'running': Experiment.select().where(Experiment.status_normalized == 'running').count(),
+        'queued': Experiment.select().where(Experiment.status_normalized == 'queued').count(),
+        'fail': Experiment.select().where(Experiment.status_normalized == 'fail').count(),
     }
     
     # Jobs
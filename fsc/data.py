@@ -5,12 +5,43 @@ These are simple data containers, not database models.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
+from enum import IntEnum
 from typing import Optional
 
-from .cache import TERMINAL_STATES
-from .utils import parse_compound_status, get_primary_status
+from .utils import parse_compound_status, get_primary_status, parse_time_ago, normalize_status
+
+
+class Status(IntEnum):
+    """Experiment status as a bit flag, so status-set checks are integer masks."""
+    RUNNING = 1
+    QUEUED = 2
+    PASS = 4
+    FAIL = 8
+    KILLED = 16
+    PREP = 32
+    UNKNOWN = 64
+    CANCELLED = 128
+
+
+_STR_TO_STATUS = {
+    'running': Status.RUNNING,
+    'queued': Status.QUEUED,
+    'prep': Status.PREP,
+    'pass': Status.PASS,
+    'fail': Status.FAIL,
+    'failed': Status.FAIL,
+    'killed': Status.KILLED,
+    'cancelled': Status.CANCELLED,
+}
+
+# Same states as cache.TERMINAL_STATES
+TERMINAL_MASK = Status.PASS | Status.FAIL | Status.KILLED | Status.CANCELLED
+ACTIVE_MASK = Status.RUNNING | Status.QUEUED | Status.PREP
+
+# Main-screen bucket indexed by status.bit_length(); None means not shown in a tab
+BUCKET_BY_BIT = (None, 'running', 'queued', 'pass', 'fail', 'killed', 'queued', None, None)
 
 
 @dataclass
@@ -38,6 +69,23 @@ class ExpData:
     # User-defined tag
     tag: str = ""
     
+    # (modified, minutes since modified) memo for sorting; see sort_key
+    _sort_key: Optional[tuple] = field(default=None, repr=False, compare=False)
+    
+    # Status flag derived from status, set once at construction
+    status_enum: Status = field(default=Status.UNKNOWN, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.status_enum = _STR_TO_STATUS.get(self.status, Status.UNKNOWN)
+    
+    @property
+    def sort_key(self) -> float:
+        """Minutes since last modification, parsed once per distinct `modified` string."""
+        memo = self._sort_key
+        if memo is None or memo[0] is not self.modified:
+            memo = self._sort_key = (self.modified, parse_time_ago(self.modified))
+        return memo[1]
+    
     @classmethod
     def from_info(cls, info) -> 'ExpData':
         """Create from ExperimentInfo."""
@@ -85,12 +133,18 @@ class ExpData:
     
     def is_terminal(self) -> bool:
         """Check if this experiment is in a terminal state."""
-        return self.status in TERMINAL_STATES
+        return bool(self.status_enum & TERMINAL_MASK)
 
 
 @dataclass
 class JobData:
     """Simple job data container."""
+    # Declared by hand (dataclass slots=True needs Python 3.10); derived slots are not fields
+    __slots__ = (
+        'index', 'name', 'status', 'duration', 'size', 'submitted', 'flags', 'portal_url',
+        'sort_key', 'normalized_status',
+    )
+    
     index: int
     name: str
     status: str
@@ -99,6 +153,15 @@ class JobData:
     submitted: str
     flags: str
     portal_url: str
+    
+    def __post_init__(self):
+        # Minutes since submission, parsed once for sorting
+        self.sort_key = parse_time_ago(self.submitted)
+        self.normalized_status = normalize_status(self.status)
+    
+    def with_status(self, status: str) -> 'JobData':
+        """Copy of this job with a new status. Jobs are shared with the detail cache, so never mutate them."""
+        return replace(self, status=status)
 
 
 @dataclass
@@ -22,23 +22,42 @@ from peewee import (
 # Default database path
 DEFAULT_DB_PATH = Path.home() / ".fsc" / "jobs.db"
 
+# Applied by peewee on every connection. WAL keeps a jobs.db-wal sidecar file next to
+# the database and lets the UI read while sync writes; the data is a re-fetchable
+# mirror of amlt, so fsyncs are skipped entirely (synchronous=OFF).
+DB_PRAGMAS = {
+    'journal_mode': 'wal',
+    'cache_size': -1024 * 64,  # 64MB cache
+    'foreign_keys': 1,
+    'synchronous': 0,
+    'temp_store': 'memory',
+    'mmap_size': 256 * 1024 * 1024,
+}
+
 
 def get_database(db_path: Optional[Path] = None) -> SqliteDatabase:
     """Get or create database connection."""
     if db_path is None:
         db_path = DEFAULT_DB_PATH
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    return SqliteDatabase(str(db_path), pragmas={
-        'journal_mode': 'wal',
-        'cache_size': -1024 * 64,  # 64MB cache
-        'foreign_keys': 1,
-        'synchronous': 0,
-    })
+    return SqliteDatabase(str(db_path), pragmas=DB_PRAGMAS)
 
 
 # Database instance (will be initialized later)
 database = SqliteDatabase(None)
 
+# Status aliases folded together in Experiment.status_normalized
+STATUS_ALIASES = {
+    'prep': 'queued',
+    'failed': 'fail',
+}
+
+
+def normalize_experiment_status(status: Optional[str]) -> str:
+    """Map a raw experiment status onto its normalized form (prep -> queued, failed -> fail)."""
+    status = (status or 'unknown').lower()
+    return STATUS_ALIASES.get(status, status)
+
 
 class BaseModel(Model):
     """Base model with common fields."""
@@ -68,11 +87,12 @@ class Experiment(BaseModel):
     AMLT Experiment (corresponds to EXPERIMENT_NAME in amlt list).
     An experiment can contain one or more jobs (hyperdrive).
     """
-    name = CharField(index=True)  # EXPERIMENT_NAME - unique identifier
+    name = CharField(unique=True)  # EXPERIMENT_NAME - unique identifier, upsert conflict target
     project = ForeignKeyField(Project, backref="experiments", null=True)
     
     # Status info (from amlt list)
     status = CharField(default="unknown")  # Running, Pass, Fail, Prep, etc.
+    status_normalized = CharField(default="unknown", index=True)  # prep -> queued, failed -> fail
     job_count = IntegerField(default=1)  # Number of jobs in this experiment
     
     # Cluster info
@@ -104,6 +124,10 @@ class Experiment(BaseModel):
         indexes = (
             (("name", "project"), True),  # Unique constraint
         )
+    
+    def save(self, *args, **kwargs):
+        self.status_normalized = normalize_experiment_status(self.status)
+        return super().save(*args, **kwargs)
 
 
 class Job(BaseModel):
@@ -157,19 +181,60 @@ def init_database(db_path: Optional[Path] = None):
     
     db_path.parent.mkdir(parents=True, exist_ok=True)
     
-    database.init(str(db_path), pragmas={
-        'journal_mode': 'wal',
-        'cache_size': -1024 * 64,
-        'foreign_keys': 1,
-        'synchronous': 0,
-    })
+    database.init(str(db_path), pragmas=DB_PRAGMAS)
     
     database.connect(reuse_if_open=True)
+    # Migrations run before create_tables, which then builds any missing model indexes
+    _migrate_status_normalized()
+    _migrate_unique_experiment_name()
     database.create_tables([Project, Experiment, Job, SyncLog], safe=True)
     
     return database
 
 
+def _migrate_status_normalized():
+    """Add and backfill experiments.status_normalized on databases created before it existed."""
+    table = Experiment._meta.table_name
+    if not database.table_exists(table):
+        return  # New database: create_tables builds the column and its index
+    
+    columns = {c.name for c in database.get_columns(table)}
+    if 'status_normalized' not in columns:
+        from playhouse.migrate import SqliteMigrator, migrate
+        
+        with database.atomic():
+            # Added without its index; create_tables creates that under the model's name
+            migrate(SqliteMigrator(database).add_column(
+                table, 'status_normalized', CharField(default="unknown")
+            ))
+            database.execute_sql(
+                f"UPDATE {table} SET status_normalized = CASE lower(status) "
+                "WHEN 'prep' THEN 'queued' WHEN 'failed' THEN 'fail' ELSE lower(status) END"
+            )
+
+
+def _migrate_unique_experiment_name():
+    """
+    Prepare databases created before experiments.name was unique: drop duplicate names and
+    the old non-unique index, so create_tables adds the model's unique index in its place.
+    """
+    table = Experiment._meta.table_name
+    if not database.table_exists(table):
+        return  # New database: create_tables builds the unique index
+    
+    name_indexes = [i for i in database.get_indexes(table) if i.columns == ['name']]
+    if any(i.unique for i in name_indexes):
+        return
+    
+    with database.atomic():
+        # Sync always keyed experiments by name, but keep only the newest row if any slipped in twice
+        database.execute_sql(
+            f"DELETE FROM {table} WHERE id NOT IN (SELECT MAX(id) FROM {table} GROUP BY name)"
+        )
+        for index in name_indexes:
+            database.execute_sql(f'DROP INDEX IF EXISTS "{index.name}"')
+
+
 def close_database():
     """Close database connection."""
     if not database.is_closed():
@@ -4,7 +4,8 @@ Experiment detail screen showing jobs grouped by status.
 
 from __future__ import annotations
 
-from typing import Optional, List, Dict
+from operator import attrgetter
+from typing import Optional, List, Dict, Set
 
 from textual import work
 from textual.app import ComposeResult
@@ -16,10 +17,25 @@ from .base import TabbedListScreen
 from .log_screen import JobLogScreen
 from ..data import ExpData, JobData
 from ..cache import TERMINAL_STATES, CachedExperimentDetail
-from ..utils import STATUS_DISPLAY, parse_time_ago, normalize_status
+from ..utils import STATUS_DISPLAY, STATUS_BUCKET
 from ..widgets import JobListItem, ConfirmDialog
 from ..amlt_parser import get_experiment_status, AmltParser, ExperimentDetail
 
+# Normalized job statuses that can still be cancelled
+ACTIVE_JOB_STATES = frozenset({'running', 'queued'})
+
+_INFO_TEMPLATE = (
+    "  [bold cyan]{name}[/]{cached}\n"
+    "  Status: [{color}]{icon} {status_name}[/]  |  "
+    "Cluster: [cyan]{cluster}[/]  |  "
+    "Jobs: {n_jobs}\n"
+    "  [cyan]● {running}[/]  "
+    "[yellow]◌ {queued}[/]  "
+    "[green]✓ {passed}[/]  "
+    "[red]✗ {failed}[/]  "
+    "[magenta]⊘ {killed}[/]"
+)
+
 
 class ExperimentDetailScreen(TabbedListScreen):
     """Screen showing experiment details and jobs grouped by status."""
@@ -43,11 +59,22 @@ class ExperimentDetailScreen(TabbedListScreen):
         *TabbedListScreen.COMMON_BINDINGS,
     ]
     
+    # Seconds to wait after a cancel before re-fetching the real job statuses
+    CANCEL_REFETCH_DELAY = 30
+    
     def __init__(self, exp: ExpData):
         super().__init__()
         self.exp = exp
         self.jobs: List[JobData] = []
         self.grouped_jobs: Dict[str, List[JobData]] = {}
+        self._cluster = ""
+        self._n_jobs = 0
+        self._fetch_inflight = False
+        self._fetch_pending = False
+        # Set after a cancel: only cache the refetched detail once every job is terminal
+        self._require_all_terminal = False
+        self._populated: Set[str] = set()  # list ids filled since the last update
+        self._last_info_key: Optional[tuple] = None
         self._tab_order = ["tab-running", "tab-queued", "tab-passed", "tab-failed", "tab-killed"]
     
     def _get_data_for_status(self, status: str) -> List[JobData]:
@@ -93,7 +120,7 @@ class ExperimentDetailScreen(TabbedListScreen):
     
     def _group_jobs(self):
         """Group jobs by status."""
-        self.grouped_jobs = {
+        grouped = {
             'running': [],
             'queued': [],
             'pass': [],
@@ -102,74 +129,86 @@ class ExperimentDetailScreen(TabbedListScreen):
         }
         
         for job in self.jobs:
-            status = normalize_status(job.status)
-            if status == 'running':
-                self.grouped_jobs['running'].append(job)
-            elif status in ('queued', 'prep'):
-                self.grouped_jobs['queued'].append(job)
-            elif status == 'pass':
-                self.grouped_jobs['pass'].append(job)
-            elif status in ('fail', 'failed'):
-                self.grouped_jobs['fail'].append(job)
-            elif status == 'killed':
-                self.grouped_jobs['killed'].append(job)
+            bucket = STATUS_BUCKET.get(job.normalized_status)
+            if bucket:
+                grouped[bucket].append(job)
+        
+        self.grouped_jobs = grouped
     
     def _update_job_lists(self):
-        """Update all job list views."""
-        for status, list_id in [
-            ('running', 'list-running'),
-            ('queued', 'list-queued'),
-            ('pass', 'list-passed'),
-            ('fail', 'list-failed'),
-            ('killed', 'list-killed'),
-        ]:
-            list_view = self.query_one(f"#{list_id}", ListView)
-            list_view.clear()
-            jobs = self.grouped_jobs.get(status, [])
-            jobs.sort(key=lambda j: parse_time_ago(j.submitted))
-            for job in jobs:
-                list_view.append(JobListItem(job))
+        """Update the job list of the active tab; other tabs are filled when first opened."""
+        for list_id in self._populated:
+            self.query_one(f"#{list_id}", ListView).clear()
+        self._populated = set()
+        self._populate_active_list()
     
-    @work(thread=True)
-    def _fetch_details(self):
-        """Fetch experiment details - use cache for terminal experiments."""
-        from ..cache import get_detail_cache
+    def _populate_active_list(self):
+        """Fill the active tab's job list if it hasn't been filled since the last update."""
+        active = self.query_one(f"#{self.TABS_ID}", TabbedContent).active
+        if active not in self.TAB_MAPPING:
+            return
         
-        self.app.call_from_thread(
-            lambda: setattr(self.query_one("#detail-loading", LoadingIndicator), 'display', True)
-        )
+        list_id, status = self.TAB_MAPPING[active]
+        if list_id in self._populated:
+            return
         
-        detail_cache = get_detail_cache()
-        cached = detail_cache.get(self.exp.name)
+        jobs = self.grouped_jobs.get(status, [])
+        jobs.sort(key=attrgetter('sort_key'))
+        self.query_one(f"#{list_id}", ListView).extend([JobListItem(job) for job in jobs])
+        self._populated.add(list_id)
+    
+    def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated):
+        self._populate_active_list()
+    
+    def _fetch_details(self):
+        """Show cached details immediately, otherwise fetch them in the background."""
+        from ..cache import get_detail_cache
         
+        cached = get_detail_cache().get(self.exp.name)
         if cached:
-            self.app.call_from_thread(self._update_display_from_cache, cached)
+            self._apply_fetch_result(None, cached)
             return
         
-        detail = get_experiment_status(self.exp.name)
+        # Coalesce refreshes requested while amlt status is already running
+        if self._fetch_inflight:
+            self._fetch_pending = True
+            return
         
-        if detail and detail.jobs:
-            detail_cache.add(self.exp.name, detail, detail.jobs)
+        self._fetch_inflight = True
+        self.query_one("#detail-loading", LoadingIndicator).display = True
+        self._fetch_details_worker()
+    
+    @work(thread=True)
+    def _fetch_details_worker(self):
+        """Fetch experiment details from amlt; _update_display caches terminal ones."""
+        detail = get_experiment_status(self.exp.name)
+        self.app.call_from_thread(self._finish_fetch, detail)
+    
+    def _finish_fetch(self, detail: Optional[ExperimentDetail]):
+        """Apply a worker result and run one more fetch if refreshes arrived meanwhile."""
+        self._fetch_inflight = False
+        self._apply_fetch_result(detail, None)
         
-        self.app.call_from_thread(self._update_display, detail)
+        if self._fetch_pending:
+            self._fetch_pending = False
+            self._fetch_details()
+    
+    def _apply_fetch_result(
+        self,
+        detail: Optional[ExperimentDetail],
+        cached: Optional[CachedExperimentDetail],
+    ):
+        """Apply a fetch result on the UI thread as a single screen update."""
+        with self.app.batch_update():
+            self.query_one("#detail-loading", LoadingIndicator).display = False
+            if cached:
+                self._update_display_from_cache(cached)
+            else:
+                self._update_display(detail)
     
     def _update_display_from_cache(self, cached: CachedExperimentDetail):
         """Update display from cached data."""
-        self.query_one("#detail-loading", LoadingIndicator).display = False
-        
-        self.jobs = []
-        for j in cached.jobs:
-            job = JobData(
-                index=j.index,
-                name=j.name,
-                status=j.status,
-                duration=j.duration,
-                size=j.size,
-                submitted=j.submitted,
-                flags=j.flags,
-                portal_url=j.portal_url,
-            )
-            self.jobs.append(job)
+        self.jobs = list(cached.job_data())
         
         self._group_jobs()
         
@@ -186,71 +225,35 @@ class ExperimentDetailScreen(TabbedListScreen):
         else:
             real_status = self.exp.status
         
-        icon, color, status_name = STATUS_DISPLAY.get(real_status, ('?', 'white', real_status))
+        self._cluster = cached.cluster
+        self._n_jobs = cached.n_jobs
+        self._update_info(real_status, cached=True)
         
-        info = (
-            f"  [bold cyan]{cached.name}[/]  [dim](cached)[/]\n"
-            f"  Status: [{color}]{icon} {status_name}[/]  |  "
-            f"Cluster: [cyan]{cached.cluster}[/]  |  "
-            f"Jobs: {cached.n_jobs}\n"
-            f"  [cyan]● {len(self.grouped_jobs['running'])}[/]  "
-            f"[yellow]◌ {len(self.grouped_jobs['queued'])}[/]  "
-            f"[green]✓ {len(self.grouped_jobs['pass'])}[/]  "
-            f"[red]✗ {len(self.grouped_jobs['fail'])}[/]  "
-            f"[magenta]⊘ {len(self.grouped_jobs['killed'])}[/]"
-        )
-        self.query_one("#exp-info", Static).update(info)
-        
-        self._update_job_lists()
         self.query_one("#job-tabs", TabbedContent).active = self._get_initial_tab()
+        self._update_job_lists()
     
     def _update_display(self, detail: Optional[ExperimentDetail]):
         """Update the display with fetched data."""
-        self.query_one("#detail-loading", LoadingIndicator).display = False
-        
         if not detail:
             self.query_one("#exp-info", Static).update("  [red]Failed to fetch details[/]")
+            self._last_info_key = None
             return
         
-        self.jobs = []
-        for job_info in detail.jobs:
-            job = JobData(
-                index=job_info.index,
-                name=job_info.name,
-                status=job_info.status.split()[0] if job_info.status else '',
-                duration=job_info.duration,
-                size=job_info.size,
-                submitted=job_info.submitted,
-                flags=job_info.flags,
-                portal_url=job_info.portal_url,
+        # Positional args follow JobData's field order
+        self.jobs = [
+            JobData(
+                j.index, j.name, j.status.split()[0] if j.status else '',
+                j.duration, j.size, j.submitted, j.flags, j.portal_url,
             )
-            self.jobs.append(job)
+            for j in detail.jobs
+        ]
         
         self._group_jobs()
         
-        job0 = next((j for j in self.jobs if j.index == 0), None)
-        
-        real_running = len(self.grouped_jobs['running'])
-        real_queued = len(self.grouped_jobs['queued'])
         real_pass = len(self.grouped_jobs['pass'])
         real_fail = len(self.grouped_jobs['fail'])
         real_killed = len(self.grouped_jobs['killed'])
-        
-        if job0 and len(self.jobs) > 1:
-            real_status = normalize_status(job0.status)
-        else:
-            if real_running > 0:
-                real_status = 'running'
-            elif real_queued > 0:
-                real_status = 'queued'
-            elif real_fail > 0:
-                real_status = 'fail'
-            elif real_killed > 0:
-                real_status = 'killed'
-            elif real_pass > 0:
-                real_status = 'pass'
-            else:
-                real_status = self.exp.status
+        real_status = self._derive_status()
         
         if real_status in TERMINAL_STATES:
             from ..cache import get_cache, get_detail_cache
@@ -264,26 +267,57 @@ class ExperimentDetailScreen(TabbedListScreen):
                 fail_count=real_fail,
                 killed_count=real_killed,
             )
-            detail_cache = get_detail_cache()
-            detail_cache.add(self.exp.name, detail, detail.jobs)
+            # After a cancel, job :0 can finish before the others; cache once all have
+            if not self._require_all_terminal or all(
+                job.normalized_status in TERMINAL_STATES for job in self.jobs
+            ):
+                get_detail_cache().add(self.exp.name, detail, detail.jobs)
         
-        icon, color, status_name = STATUS_DISPLAY.get(real_status, ('?', 'white', real_status))
+        self._cluster = detail.cluster
+        self._n_jobs = detail.n_jobs
+        self._update_info(real_status)
+        
+        self.query_one("#job-tabs", TabbedContent).active = self._get_initial_tab()
+        self._update_job_lists()
+    
+    def _derive_status(self) -> str:
+        """Derive the experiment status from job :0 (multi-job) or the grouped job counts."""
+        job0 = next((j for j in self.jobs if j.index == 0), None)
+        if job0 and len(self.jobs) > 1:
+            return job0.normalized_status
         
-        info = (
-            f"  [bold cyan]{self.exp.name}[/]\n"
-            f"  Status: [{color}]{icon} {status_name}[/]  |  "
-            f"Cluster: [cyan]{detail.cluster}[/]  |  "
-            f"Jobs: {detail.n_jobs}\n"
-            f"  [cyan]● {real_running}[/]  "
-            f"[yellow]◌ {real_queued}[/]  "
-            f"[green]✓ {real_pass}[/]  "
-            f"[red]✗ {real_fail}[/]  "
-            f"[magenta]⊘ {real_killed}[/]"
+        for status in ('running', 'queued', 'fail', 'killed', 'pass'):
+            if self.grouped_jobs[status]:
+                return status
+        return self.exp.status
+    
+    def _update_info(self, real_status: str, cached: bool = False):
+        """Render the experiment info panel from the current job groups, if anything changed."""
+        g = self.grouped_jobs
+        key = (
+            real_status, cached, self._cluster, self._n_jobs,
+            len(g['running']), len(g['queued']), len(g['pass']), len(g['fail']), len(g['killed']),
         )
-        self.query_one("#exp-info", Static).update(info)
+        if key == self._last_info_key:
+            return
+        self._last_info_key = key
         
-        self._update_job_lists()
-        self.query_one("#job-tabs", TabbedContent).active = self._get_initial_tab()
+        icon, color, status_name = STATUS_DISPLAY.get(real_status, ('?', 'white', real_status))
+        info = _INFO_TEMPLATE.format(
+            name=self.exp.name,
+            cached="  [dim](cached)[/]" if cached else "",
+            color=color,
+            icon=icon,
+            status_name=status_name,
+            cluster=self._cluster,
+            n_jobs=self._n_jobs,
+            running=key[4],
+            queued=key[5],
+            passed=key[6],
+            failed=key[7],
+            killed=key[8],
+        )
+        self.query_one("#exp-info", Static).update(info)
     
     def action_go_back(self):
         self.app.pop_screen()
@@ -305,7 +339,7 @@ class ExperimentDetailScreen(TabbedListScreen):
         list_view, jobs = self._get_current_list()
         if list_view.index is not None and list_view.index < len(jobs):
             job = jobs[list_view.index]
-            if job.status.lower() in ('running', 'queued', 'prep'):
+            if job.normalized_status in ACTIVE_JOB_STATES:
                 self.app.push_screen(
                     ConfirmDialog(
                         f"Cancel job [bold cyan]{job.name}[/] in [bold]{self.exp.name}[/]?",
@@ -335,25 +369,51 @@ class ExperimentDetailScreen(TabbedListScreen):
     @work(thread=True)
     def _do_cancel_job(self, job: JobData):
         """Cancel a specific job."""
-        parser = AmltParser()
-        success, _, stderr = parser.run_amlt_command([
+        success, _, stderr = AmltParser.run_amlt_command([
             'amlt', 'cancel', '-y', self.exp.name, f':{job.index}'
         ])
         
         if success:
-            self.app.call_from_thread(self._fetch_details)
-            self.app.call_from_thread(lambda: self.notify(f"Cancelled {job.name}"))
+            self.app.call_from_thread(self._apply_local_cancel, [job], f"Cancelled {job.name}")
         else:
             self.app.call_from_thread(lambda: self.notify(f"Failed: {stderr}", severity="error"))
     
     @work(thread=True)
     def _do_cancel_all(self):
         """Cancel all jobs."""
-        parser = AmltParser()
-        success, _, stderr = parser.run_amlt_command(['amlt', 'cancel', '-y', self.exp.name])
+        success, _, stderr = AmltParser.run_amlt_command(['amlt', 'cancel', '-y', self.exp.name])
         
         if success:
-            self.app.call_from_thread(self._fetch_details)
-            self.app.call_from_thread(lambda: self.notify(f"Cancelled all jobs"))
+            active_jobs = self.grouped_jobs.get('running', []) + self.grouped_jobs.get('queued', [])
+            self.app.call_from_thread(self._apply_local_cancel, active_jobs, "Cancelled all jobs")
         else:
             self.app.call_from_thread(lambda: self.notify(f"Failed: {stderr}", severity="error"))
+    
+    def _apply_local_cancel(self, jobs: List[JobData], message: str):
+        """
+        Move cancelled jobs to the killed tab without re-running amlt status.
+        A full refetch is scheduled after CANCEL_REFETCH_DELAY to pick up the real state.
+        """
+        from ..cache import get_detail_cache
+        
+        killed: Dict[int, JobData] = {}  # job index -> replacement
+        for job in jobs:
+            for status in ('running', 'queued'):
+                if job in self.grouped_jobs[status]:
+                    self.grouped_jobs[status].remove(job)
+                    # New objects rather than in-place updates: cached JobData is shared
+                    killed[job.index] = job.with_status('killed')
+                    self.grouped_jobs['killed'].append(killed[job.index])
+                    break
+        self.jobs = [killed.get(job.index, job) for job in self.jobs]
+        
+        with self.app.batch_update():
+            self._update_info(self._derive_status())
+            self._update_job_lists()
+        
+        self.notify(message)
+        # A cached detail would answer the refetch with stale pre-cancel jobs, so drop it;
+        # it is re-added once amlt reports every job terminal
+        get_detail_cache().remove(self.exp.name)
+        self._require_all_terminal = True
+        self.set_timer(self.CANCEL_REFETCH_DELAY, self._fetch_details)
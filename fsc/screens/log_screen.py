@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import os
 import re
+from typing import Dict, Optional, Tuple
 
 from textual import work
 from textual.app import ComposeResult
@@ -14,8 +15,46 @@ from textual.binding import Binding
 from textual.containers import VerticalScroll
 from textual.widgets import Header, Footer, Static, Rule, Log
 
+from ..cache import TERMINAL_STATES
 from ..data import JobData
-from ..utils import STATUS_DISPLAY, format_time_ago, get_amlt_output_dir
+from ..utils import STATUS_DISPLAY, format_time_ago, get_amlt_output_dir, tail_lines
+
+_RETRY_DIR_RE = re.compile(r'retry_(\d+)')
+_RETRY_LOG_RE = re.compile(r'user_logs/retry_(\d+)/std_log_process_\d+\.txt')
+
+# Marker written into a job log dir when logs were downloaded after the job finished
+_FINAL_LOGS_MARKER = ".fsc_final"
+
+# job log dir -> (dir mtime_ns, log file path) from the last _find_log_file walk
+_LOG_FILE_CACHE: Dict[str, Tuple[int, str]] = {}
+
+
+def _scan_log_files(path: str, retry_num: int) -> Optional[Tuple[int, str]]:
+    """
+    Find the (retry_num, path) of the log file with the highest retry number under path.
+    retry_num is inherited from the nearest enclosing retry_N directory (-1 if none).
+    """
+    best = None
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry)
+                elif name.endswith('.txt') and (name.startswith('std_log') or name == 'stdout.txt'):
+                    if best is None or retry_num > best[0]:
+                        best = (retry_num, entry.path)
+    except OSError:
+        return None
+    
+    for entry in subdirs:
+        match = _RETRY_DIR_RE.match(entry.name)
+        found = _scan_log_files(entry.path, int(match.group(1)) if match else retry_num)
+        if found and (best is None or found[0] > best[0]):
+            best = found
+    
+    return best
 
 
 class JobLogScreen(Screen):
@@ -25,6 +64,7 @@ class JobLogScreen(Screen):
         Binding("escape", "go_back", "Back"),
         Binding("q", "go_back", "Back"),
         Binding("r", "refresh_logs", "Refresh"),
+        Binding("d", "download_logs", "Download"),
     ]
     
     def __init__(self, exp_name: str, job: JobData):
@@ -71,27 +111,25 @@ class JobLogScreen(Screen):
     def _find_log_file(self) -> str:
         """Find the log file, preferring latest retry logs."""
         job_log_dir = self._get_job_log_dir()
-        if not os.path.isdir(job_log_dir):
+        try:
+            mtime_ns = os.stat(job_log_dir).st_mtime_ns
+        except OSError:
             return ""
         
-        log_files = []
-        for root, dirs, files in os.walk(job_log_dir):
-            for f in files:
-                if f.endswith('.txt') and ('std_log' in f or f == 'stdout.txt'):
-                    full_path = os.path.join(root, f)
-                    match = re.search(r'retry_(\d+)', root)
-                    retry_num = int(match.group(1)) if match else -1
-                    log_files.append((retry_num, full_path))
+        cached = _LOG_FILE_CACHE.get(job_log_dir)
+        if cached and cached[0] == mtime_ns and os.path.exists(cached[1]):
+            return cached[1]
         
-        if not log_files:
+        best = _scan_log_files(job_log_dir, -1)
+        if not best:
             return ""
         
-        log_files.sort(key=lambda x: x[0], reverse=True)
-        return log_files[0][1]
+        _LOG_FILE_CACHE[job_log_dir] = (mtime_ns, best[1])
+        return best[1]
     
     def _load_logs(self):
         """Load logs - auto refresh for running jobs, use cache for others."""
-        if self.job.status.lower() == 'running':
+        if self.job.normalized_status == 'running':
             self._download_and_display()
             return
         
@@ -112,57 +150,63 @@ class JobLogScreen(Screen):
             mtime = os.path.getmtime(log_path)
             time_ago = format_time_ago(mtime)
             
-            with open(log_path, 'r') as f:
-                lines = f.readlines()
+            display_lines = tail_lines(log_path, 200)
+            status.update(f"  [dim]{log_path}[/]\n  [dim]Showing last {len(display_lines)} lines | cached {time_ago}[/]")
             
-            display_lines = lines[-200:] if len(lines) > 200 else lines
-            status.update(f"  [dim]{log_path}[/]\n  [dim]Showing last {len(display_lines)} of {len(lines)} lines | cached {time_ago}[/]")
-            
-            for line in display_lines:
-                log_widget.write_line(line.rstrip())
+            log_widget.write_lines(line.rstrip() for line in display_lines)
         except Exception as e:
             status.update(f"  [red]Error: {e}[/]")
     
     def _get_latest_log_filename(self) -> str:
         """Get the latest log filename by listing available logs."""
         import subprocess
+        import threading
         
         cmd = ['amlt', 'logs', '--list', self.exp_name, f':{self.job.index}']
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            if result.returncode != 0:
-                return ""
-            
-            lines = result.stdout.strip().split('\n')
-            retry_logs = []
-            for line in lines:
+            proc = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1
+            )
+        except Exception:
+            return ""
+        
+        # Scan lines as they arrive instead of buffering the whole listing
+        timer = threading.Timer(30, proc.kill)
+        timer.start()
+        best_retry, best_line, fallback = -1, "", ""
+        try:
+            for line in proc.stdout:
                 line = line.strip()
-                match = re.search(r'user_logs/retry_(\d+)/std_log_process_\d+\.txt', line)
+                match = _RETRY_LOG_RE.search(line)
                 if match:
                     retry_num = int(match.group(1))
-                    retry_logs.append((retry_num, line))
-            
-            if retry_logs:
-                retry_logs.sort(key=lambda x: x[0], reverse=True)
-                return retry_logs[0][1]
-            
-            for line in lines:
-                if 'std_log_process_0.txt' in line and 'retry' not in line:
-                    return line.strip()
-            
-            return ""
+                    if retry_num > best_retry:
+                        best_retry, best_line = retry_num, line
+                elif not fallback and 'std_log_process_0.txt' in line and 'retry' not in line:
+                    fallback = line
+            returncode = proc.wait()
         except Exception:
+            proc.kill()
+            proc.wait()
             return ""
+        finally:
+            timer.cancel()
+            proc.stdout.close()
+        
+        if returncode != 0:
+            return ""
+        return best_line or fallback
     
-    @work(thread=True)
     def _download_and_display(self):
+        """Show download progress and fetch logs in the background."""
+        self.query_one("#log-status", Static).update("  [yellow]Finding latest logs...[/]")
+        self._download_logs()
+    
+    @work(thread=True)
+    def _download_logs(self):
         """Download logs using amlt to job-specific directory."""
         import subprocess
         
-        self.app.call_from_thread(
-            lambda: self.query_one("#log-status", Static).update("  [yellow]Finding latest logs...[/]")
-        )
-        
         latest_log = self._get_latest_log_filename()
         job_log_dir = self._get_job_log_dir()
         os.makedirs(job_log_dir, exist_ok=True)
@@ -178,38 +222,56 @@ class JobLogScreen(Screen):
         else:
             cmd = ['amlt', 'logs', '-o', job_log_dir, self.exp_name, f':{self.job.index}']
         
+        log_path = ""
         try:
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
             if result.returncode == 0:
+                # New files may land in existing subdirs without touching the top-level mtime
+                _LOG_FILE_CACHE.pop(job_log_dir, None)
                 log_path = self._find_log_file()
-                if log_path:
-                    self.app.call_from_thread(self._display_local_logs, log_path)
-                else:
-                    self.app.call_from_thread(
-                        lambda: self.query_one("#log-status", Static).update(
-                            f"  [yellow]Download completed but log file not found[/]\n  [dim]Dir: {job_log_dir}[/]"
-                        )
-                    )
+                if log_path and self._is_terminal():
+                    open(os.path.join(job_log_dir, _FINAL_LOGS_MARKER), 'w').close()
+                status_text = (
+                    f"  [yellow]Download completed but log file not found[/]\n  [dim]Dir: {job_log_dir}[/]"
+                )
             else:
                 error_msg = result.stderr.strip() if result.stderr else "Unknown error"
-                self.app.call_from_thread(
-                    lambda: self.query_one("#log-status", Static).update(
-                        f"  [red]Download failed: {error_msg}[/]\n  [dim]Command: {' '.join(cmd)}[/]"
-                    )
-                )
+                status_text = f"  [red]Download failed: {error_msg}[/]\n  [dim]Command: {' '.join(cmd)}[/]"
         except subprocess.TimeoutExpired:
-            self.app.call_from_thread(
-                lambda: self.query_one("#log-status", Static).update("  [red]Download timeout (120s)[/]")
-            )
+            status_text = "  [red]Download timeout (120s)[/]"
         except Exception as e:
-            self.app.call_from_thread(
-                lambda: self.query_one("#log-status", Static).update(f"  [red]Error: {e}[/]")
-            )
+            status_text = f"  [red]Error: {e}[/]"
+        
+        self.app.call_from_thread(self._apply_download_result, status_text, log_path)
+    
+    def _apply_download_result(self, status_text: str, log_path: str):
+        """Show downloaded logs, or the failure status, in a single screen update."""
+        with self.app.batch_update():
+            if log_path:
+                self._display_local_logs(log_path)
+            else:
+                self.query_one("#log-status", Static).update(status_text)
     
     def action_go_back(self):
         self.app.pop_screen()
     
+    def _is_terminal(self) -> bool:
+        """Check if the job had finished, so its logs will not change any more."""
+        return self.job.normalized_status in TERMINAL_STATES
+    
     def action_refresh_logs(self):
-        """Refresh logs - download fresh and display."""
+        """Refresh logs - re-read final logs from disk, otherwise download fresh."""
+        if self._is_terminal() and os.path.exists(
+            os.path.join(self._get_job_log_dir(), _FINAL_LOGS_MARKER)
+        ):
+            log_path = self._find_log_file()
+            if log_path:
+                self._display_local_logs(log_path)
+                return
+        
+        self.action_download_logs()
+    
+    def action_download_logs(self):
+        """Download fresh logs and display, even if final logs are on disk."""
         self.query_one("#job-log", Log).clear()
         self._download_and_display()
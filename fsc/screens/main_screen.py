@@ -4,10 +4,14 @@ Main screen showing experiments grouped by status.
 
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict
+from operator import attrgetter
+from typing import List, Dict, Optional, Tuple
 
 from textual import work
+from textual.worker import get_current_worker
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container
@@ -15,11 +19,13 @@ from textual.widgets import Header, Footer, Static, ListView, TabbedContent, Tab
 
 from .base import TabbedListScreen
 from .detail_screen import ExperimentDetailScreen
-from ..data import ExpData, StatusChange
+from ..data import ACTIVE_MASK, BUCKET_BY_BIT, ExpData, StatusChange
 from ..cache import get_cache, get_tag_cache, TERMINAL_STATES
 from ..utils import STATUS_DISPLAY, parse_time_ago
 from ..widgets import ExperimentListItem, NotificationBar, ConfirmDialog, TagInputDialog
-from ..amlt_parser import get_experiments, get_experiment_status, AmltParser, ExperimentInfo
+from ..amlt_parser import (
+    STATUS_WORKERS, get_experiments, get_experiment_status_limited, AmltParser, ExperimentInfo,
+)
 
 # Try to import pyperclip for clipboard support
 try:
@@ -28,6 +34,14 @@ try:
 except ImportError:
     HAS_CLIPBOARD = False
 
+# Raw job statuses (first word, lowercased) that mean a job has finished
+_TERMINAL_RAW = frozenset({'pass', 'fail', 'failed', 'killed'})
+
+
+def _first_word_lower(s: str) -> str:
+    """First word of a status string, lowercased: 'Pass (2h)' -> 'pass'."""
+    return s.partition(' ')[0].lower() if s else ''
+
 
 class MainScreen(TabbedListScreen):
     """Main screen showing experiments grouped by status."""
@@ -41,6 +55,15 @@ class MainScreen(TabbedListScreen):
         "tab-killed": ("list-killed", 'killed'),
     }
     
+    # status -> list view, in display order
+    _STATUS_LIST_IDS = (
+        ('running', 'list-running'),
+        ('queued', 'list-queued'),
+        ('pass', 'list-passed'),
+        ('fail', 'list-failed'),
+        ('killed', 'list-killed'),
+    )
+    
     BINDINGS = [
         Binding("enter", "select_experiment", "Open", priority=True),
         Binding("r", "refresh", "Refresh"),
@@ -52,12 +75,23 @@ class MainScreen(TabbedListScreen):
         *TabbedListScreen.COMMON_BINDINGS,
     ]
     
+    # Delta polls only see rows modified recently, so status changes on older rows are
+    # picked up by a full re-read after this many consecutive delta polls
+    MAX_DELTA_POLLS = 2
+    # Past an hour, "modified" is reported in hours and too coarse to filter a delta on
+    DELTA_MAX_AGE = 3600
+    
     def __init__(self):
         super().__init__()
         self.all_experiments: List[ExpData] = []
         self.grouped: Dict[str, List[ExpData]] = {}
         self.last_statuses: Dict[str, str] = {}
+        self._exp_infos: Dict[str, ExperimentInfo] = {}  # exp name -> latest `amlt list` row
+        self._latest_modified: Optional[float] = None  # newest modified time seen, Unix ts
+        self._delta_polls = 0  # delta polls since the last full fetch
         self.tag_cache = get_tag_cache()
+        self._row_widgets: Dict[str, ExperimentListItem] = {}  # exp name -> mounted row
+        self._list_order: Dict[str, List[str]] = {}  # status -> exp names in list order
         self._tab_order = ["tab-queued", "tab-running", "tab-passed", "tab-failed", "tab-killed"]
     
     def _get_data_for_status(self, status: str) -> List[ExpData]:
@@ -86,11 +120,14 @@ class MainScreen(TabbedListScreen):
         yield Footer()
     
     def on_mount(self):
-        self.query_one("#notifications", NotificationBar).display = False
+        self._notifications = self.query_one("#notifications", NotificationBar)
+        self._notifications.display = False
+        self._list_views: Dict[str, ListView] = {
+            status: self.query_one(f"#{list_id}", ListView) for status, list_id in self._STATUS_LIST_IDS
+        }
         self.cache = get_cache()
         self._fetch_experiments()
-        self.set_interval(300, self._fetch_experiments)
-        self.set_interval(300, self._correct_active_statuses)
+        self.set_interval(300, self._periodic)
     
     def _show_loading(self):
         """Show loading indicator."""
@@ -100,21 +137,68 @@ class MainScreen(TabbedListScreen):
         """Hide loading indicator."""
         self.query_one("#main-loading-text", Static).update("")
     
-    @work(thread=True)
-    def _fetch_experiments(self):
+    # Fetch workers share one exclusive group: a newer fetch supersedes an in-flight one
+    @work(thread=True, exclusive=True, group="fetch", name="fetch_experiments")
+    def _fetch_experiments(self, full: bool = False):
         """Fetch experiments in background thread."""
+        worker = get_current_worker()
         self.app.call_from_thread(self._show_loading)
+        result = self._load_experiments(full)
+        if worker.is_cancelled:
+            return
+        self.app.call_from_thread(self._update_display, *result)
+    
+    @work(thread=True, exclusive=True, group="fetch", name="periodic")
+    def _periodic(self, full: bool = False, correct: bool = True):
+        """
+        Refresh cycle in one worker: fetch and display experiments, then correct
+        the status of active ones against their job :0 status.
+        """
+        worker = get_current_worker()
+        self.app.call_from_thread(self._show_loading)
+        result = self._load_experiments(full)
+        if worker.is_cancelled:
+            return
+        # call_from_thread waits for the display update, so self.grouped is current below
+        self.app.call_from_thread(self._update_display, *result)
+        
+        if correct:
+            corrections = self._find_status_corrections()
+            if corrections and not worker.is_cancelled:
+                self.app.call_from_thread(self._apply_status_corrections, corrections)
+    
+    def _load_experiments(self, full: bool) -> Tuple[List[ExperimentInfo], list, bool]:
+        """
+        Fetch list rows and the cached experiments they don't cover (worker thread).
+        Periodic polls only fetch experiments modified since the newest one seen;
+        a full fetch (startup, explicit refresh, every few polls) re-reads the 50 most recent.
+        """
+        full = (
+            full
+            or self._latest_modified is None
+            or self._delta_polls >= self.MAX_DELTA_POLLS
+            or time.time() - self._latest_modified >= self.DELTA_MAX_AGE
+        )
+        if full:
+            self._delta_polls = 0
+            exp_infos = get_experiments(n_recent=50)
+        else:
+            self._delta_polls += 1
+            exp_infos = get_experiments(n_recent=10, since=self._latest_modified)
         
-        exp_infos = get_experiments(n_recent=50)
-        cached_exps = self.cache.get_all()
+        # Only cached experiments that the list rows won't already cover
+        api_exp_names = {info.name for info in exp_infos}
+        if not full:
+            api_exp_names.update(list(self._exp_infos))
+        cached_exps = self.cache.get_except(api_exp_names)
         
-        self.app.call_from_thread(self._update_display, exp_infos, cached_exps)
+        return exp_infos, cached_exps, full
 
-    @work(thread=True, exclusive=True, name="correct_status")
-    def _correct_active_statuses(self):
+    def _find_status_corrections(self) -> list:
         """
-        Background task to correct status of active experiments.
-        Fetches detailed status for running/queued experiments and updates cache.
+        Correct status of active experiments (worker thread).
+        Fetches detailed status for running/queued experiments and returns
+        (name, old_status, new_status, detail) for those whose jobs have finished.
         """
         active_exps = []
         for status in ('running', 'queued'):
@@ -122,37 +206,43 @@ class MainScreen(TabbedListScreen):
                 active_exps.extend(self.grouped[status])
         
         if not active_exps:
-            return
+            return []
         
         active_exps = active_exps[:10]
         corrections = []
         
-        for exp in active_exps:
-            detail = get_experiment_status(exp.name)
-            if not detail or not detail.jobs:
-                continue
-            
-            if len(detail.jobs) > 1:
-                job0 = next((j for j in detail.jobs if j.index == 0), None)
-                if job0:
-                    job0_status = job0.status.lower().split()[0] if job0.status else ''
-                    if job0_status in ('pass', 'fail', 'failed', 'killed'):
-                        new_status = job0_status if job0_status != 'failed' else 'fail'
+        # Same concurrency and rate bounds as the sync service's status fan-out
+        with ThreadPoolExecutor(max_workers=STATUS_WORKERS) as pool:
+            futures = {pool.submit(get_experiment_status_limited, exp.name): exp for exp in active_exps}
+            for future in as_completed(futures):
+                exp = futures[future]
+                try:
+                    detail = future.result()
+                except Exception:
+                    continue
+                if not detail or not detail.jobs:
+                    continue
+                
+                if len(detail.jobs) > 1:
+                    job0 = next((j for j in detail.jobs if j.index == 0), None)
+                    if job0:
+                        job0_status = _first_word_lower(job0.status)
+                        if job0_status in _TERMINAL_RAW:
+                            new_status = job0_status if job0_status != 'failed' else 'fail'
+                            if exp.status != new_status:
+                                corrections.append((exp.name, exp.status, new_status, detail))
+                else:
+                    job_status = _first_word_lower(detail.jobs[0].status)
+                    if job_status in _TERMINAL_RAW:
+                        new_status = job_status if job_status != 'failed' else 'fail'
                         if exp.status != new_status:
                             corrections.append((exp.name, exp.status, new_status, detail))
-            else:
-                job_status = detail.jobs[0].status.lower().split()[0] if detail.jobs[0].status else ''
-                if job_status in ('pass', 'fail', 'failed', 'killed'):
-                    new_status = job_status if job_status != 'failed' else 'fail'
-                    if exp.status != new_status:
-                        corrections.append((exp.name, exp.status, new_status, detail))
         
-        if corrections:
-            self.app.call_from_thread(self._apply_status_corrections, corrections)
+        return corrections
     
     def _apply_status_corrections(self, corrections):
         """Apply status corrections and update display."""
-        notifications = self.query_one("#notifications", NotificationBar)
+        notifications = self._notifications
         
         for exp_name, old_status, new_status, detail in corrections:
             self.cache.force_add(
@@ -162,7 +252,7 @@ class MainScreen(TabbedListScreen):
                 job_count=detail.n_jobs,
                 pass_count=detail.pass_count,
                 fail_count=detail.fail_count,
-                killed_count=len([j for j in detail.jobs if j.status.lower().split()[0] == 'killed']),
+                killed_count=sum(1 for j in detail.jobs if _first_word_lower(j.status) == 'killed'),
             )
             
             notifications.add_notification(StatusChange(
@@ -172,17 +262,27 @@ class MainScreen(TabbedListScreen):
             ))
             notifications.display = True
         
-        self._fetch_experiments()
+        # Corrected experiments are older rows a delta fetch would skip
+        self._fetch_experiments(full=True)
 
-    def _update_display(self, exp_infos: List[ExperimentInfo], cached_exps=None):
-        """Update experiments display."""
+    def _update_display(self, exp_infos: List[ExperimentInfo], cached_exps=None, full: bool = True):
+        """Update experiments display, merging a delta fetch into the rows already known."""
         self._hide_loading()
         
-        notifications = self.query_one("#notifications", NotificationBar)
+        if full:
+            self._exp_infos = {}
+        now = time.time()
+        for info in exp_infos:
+            self._exp_infos[info.name] = info
+            modified = now - parse_time_ago(info.modified) * 60
+            if self._latest_modified is None or modified > self._latest_modified:
+                self._latest_modified = modified
+        
+        notifications = self._notifications
         api_exp_names = set()
         
         self.all_experiments = []
-        for info in exp_infos:
+        for info in self._exp_infos.values():
             exp = ExpData.from_info(info)
             # Load tag from cache
             exp.tag = self.tag_cache.get(exp.name)
@@ -209,29 +309,15 @@ class MainScreen(TabbedListScreen):
                     exp.tag = self.tag_cache.get(exp.name)
                     self.all_experiments.append(exp)
         
-        self.grouped = {
-            'running': [],
-            'queued': [],
-            'pass': [],
-            'fail': [],
-            'killed': [],
-        }
+        self.grouped = {k: [] for k in ('running', 'queued', 'pass', 'fail', 'killed')}
         
         for exp in self.all_experiments:
-            status = exp.status
-            if status == 'running':
-                self.grouped['running'].append(exp)
-            elif status in ('queued', 'prep'):
-                self.grouped['queued'].append(exp)
-            elif status == 'pass':
-                self.grouped['pass'].append(exp)
-            elif status in ('fail', 'failed'):
-                self.grouped['fail'].append(exp)
-            elif status == 'killed':
-                self.grouped['killed'].append(exp)
+            bucket = BUCKET_BY_BIT[exp.status_enum.bit_length()]
+            if bucket:
+                self.grouped[bucket].append(exp)
         
         for status in self.grouped:
-            self.grouped[status].sort(key=lambda e: parse_time_ago(e.modified))
+            self.grouped[status].sort(key=attrgetter('sort_key'))
         
         cached_count = sum(1 for e in self.all_experiments if e.from_cache)
         
@@ -248,24 +334,63 @@ class MainScreen(TabbedListScreen):
         summary += "[/]"
         self.query_one("#summary-bar", Static).update(summary)
         
-        for status, list_id in [
-            ('running', 'list-running'),
-            ('queued', 'list-queued'),
-            ('pass', 'list-passed'),
-            ('fail', 'list-failed'),
-            ('killed', 'list-killed'),
-        ]:
-            list_view = self.query_one(f"#{list_id}", ListView)
-            list_view.clear()
-            for exp in self.grouped[status]:
-                list_view.append(ExperimentListItem(exp))
+        self._sync_list_views()
+    
+    def _sync_list_views(self):
+        """
+        Bring the list views in line with self.grouped by diffing against the mounted rows:
+        rows that left a list are removed, new rows are mounted in place, moved rows are
+        re-ordered, and rows that stayed only re-render if their text changed.
+        """
+        # Drop rows that are no longer in their list first, so rows that changed
+        # status are re-created in their new list below
+        for status, _ in self._STATUS_LIST_IDS:
+            wanted = {exp.name for exp in self.grouped[status]}
+            order = self._list_order.setdefault(status, [])
+            for name in order:
+                if name not in wanted:
+                    self._row_widgets.pop(name).remove()
+            order[:] = [name for name in order if name in wanted]
+        
+        for status, list_view in self._list_views.items():
+            order = self._list_order[status]
+            # Runs of consecutive new rows are mounted together, in one layout pass
+            pending: List[ExperimentListItem] = []
+            pending_anchor = None
+            for i, exp in enumerate(self.grouped[status]):
+                widget = self._row_widgets.get(exp.name)
+                # Position against the live row currently in slot i; removed rows may
+                # linger in the DOM until pruned, so child indices can't be trusted
+                anchor = self._row_widgets[order[i]] if i < len(order) else None
+                if widget is None:
+                    widget = ExperimentListItem(exp)
+                    self._row_widgets[exp.name] = widget
+                    if not pending:
+                        pending_anchor = anchor
+                    pending.append(widget)
+                    order.insert(i, exp.name)
+                    continue
+                
+                if pending:
+                    list_view.mount_all(pending, before=pending_anchor)
+                    pending = []
+                if anchor is not widget:
+                    list_view.move_child(widget, before=anchor)
+                    order.remove(exp.name)
+                    order.insert(i, exp.name)
+                widget.update_from(exp)
+            if pending:
+                list_view.mount_all(pending, before=pending_anchor)
+            
+            if not order:
+                list_view.index = None
+            elif list_view.index is None or list_view.index >= len(order):
+                list_view.index = min(list_view.index or 0, len(order) - 1)
     
     def action_refresh(self):
         self._show_loading()
-        self._fetch_experiments()
         tabs = self.query_one("#tabs", TabbedContent)
-        if tabs.active in ("tab-queued", "tab-running"):
-            self._correct_active_statuses()
+        self._periodic(full=True, correct=tabs.active in ("tab-queued", "tab-running"))
     
     def action_select_experiment(self):
         """Open selected experiment."""
@@ -279,7 +404,7 @@ class MainScreen(TabbedListScreen):
         list_view, experiments = self._get_current_list()
         if list_view.index is not None and list_view.index < len(experiments):
             exp = experiments[list_view.index]
-            if exp.status in ('running', 'queued', 'prep'):
+            if exp.status_enum & ACTIVE_MASK:
                 self.app.push_screen(
                     ConfirmDialog(
                         f"[bold red]DANGER:[/] Cancel experiment [bold cyan]{exp.name}[/]?\n\nThis will kill ALL jobs in this experiment!",
@@ -294,10 +419,9 @@ class MainScreen(TabbedListScreen):
     @work(thread=True)
     def _do_cancel(self, exp: ExpData):
         """Cancel an experiment."""
-        parser = AmltParser()
-        success, stdout, stderr = parser.run_amlt_command(['amlt', 'cancel', '-y', exp.name])
+        success, stdout, stderr = AmltParser.run_amlt_command(['amlt', 'cancel', '-y', exp.name])
         if success:
-            self.app.call_from_thread(self._fetch_experiments)
+            self.app.call_from_thread(self._fetch_experiments, True)
             self.app.call_from_thread(lambda: self.notify(f"✓ Cancelled {exp.name}"))
         else:
             error_msg = stderr or stdout or "Unknown error"
@@ -320,7 +444,7 @@ class MainScreen(TabbedListScreen):
                 self.notify(f"📋 {exp.name} (install pyperclip for clipboard)", timeout=5)
     
     def action_clear_notifications(self):
-        self.query_one("#notifications", NotificationBar).clear()
+        self._notifications.clear()
     
     def action_set_tag(self):
         """Set a tag for the selected experiment."""
@@ -337,23 +461,15 @@ class MainScreen(TabbedListScreen):
         """Apply tag to experiment and refresh display."""
         self.tag_cache.set(exp.name, tag)
         exp.tag = tag
-        # Refresh the current list to show updated tag
-        self._refresh_current_list()
+        # Refresh the row to show updated tag
+        self._refresh_current_list(exp)
         if tag:
             self.notify(f"🏷️ Tagged '{exp.name}' as #{tag}", timeout=2)
         else:
             self.notify(f"🏷️ Removed tag from '{exp.name}'", timeout=2)
     
-    def _refresh_current_list(self):
-        """Refresh the current list view to reflect changes."""
-        for status, list_id in [
-            ('running', 'list-running'),
-            ('queued', 'list-queued'),
-            ('pass', 'list-passed'),
-            ('fail', 'list-failed'),
-            ('killed', 'list-killed'),
-        ]:
-            list_view = self.query_one(f"#{list_id}", ListView)
-            list_view.clear()
-            for exp in self.grouped.get(status, []):
-                list_view.append(ExperimentListItem(exp))
+    def _refresh_current_list(self, exp: ExpData):
+        """Re-render the row of an experiment whose data changed."""
+        widget = self._row_widgets.get(exp.name)
+        if widget is not None:
+            widget.update_from(exp)
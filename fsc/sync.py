@@ -3,23 +3,104 @@ Sync service for keeping the local database up-to-date with AMLT.
 Runs in the background and periodically fetches job status.
 """
 
+import atexit
+import hashlib
+import queue
+import random
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Callable, Optional, List
+from typing import Callable, Dict, Optional, List, Tuple
 import logging
 
+from peewee import chunked
+
 from .models import (
     Experiment, Job, Project, SyncLog, 
-    init_database, database
+    init_database, database, normalize_experiment_status
 )
 from .amlt_parser import (
-    AmltParser, ExperimentInfo, ExperimentDetail,
+    AmltParser, ExperimentDetail, RateLimiter, STATUS_LIMITER, STATUS_WORKERS,
     get_experiments, get_experiment_status
 )
 
 logger = logging.getLogger(__name__)
 
+# Job columns refreshed from `amlt status` on every detail sync
+JOB_SYNC_FIELDS = [
+    Job.job_name, Job.status, Job.duration, Job.size,
+    Job.flags, Job.portal_url, Job.submitted_at_str, Job.updated_at,
+]
+
+# SyncLog rows are telemetry: buffer them and write in batches off the sync path
+SYNC_LOG_FLUSH_INTERVAL = 2  # seconds
+SYNC_LOG_RETENTION = timedelta(days=7)
+
+_log_queue: "queue.Queue[dict]" = queue.Queue()
+_log_drainer: Optional[threading.Thread] = None
+_log_drainer_lock = threading.Lock()
+
+
+def queue_sync_log(sync_type: str, **fields):
+    """Queue a SyncLog row; the drainer thread (started on first use) writes it."""
+    global _log_drainer
+    now = datetime.now()
+    row = {
+        'sync_type': sync_type,
+        'experiment_name': None,
+        'success': True,
+        'message': None,
+        'duration_seconds': None,
+        'created_at': now,
+        'updated_at': now,
+    }
+    row.update(fields)  # every row needs the same keys for insert_many
+    _log_queue.put_nowait(row)
+    
+    if _log_drainer is None:
+        with _log_drainer_lock:
+            if _log_drainer is None:
+                _log_drainer = threading.Thread(target=_drain_sync_logs, daemon=True)
+                _log_drainer.start()
+                atexit.register(flush_sync_logs)
+
+
+def flush_sync_logs() -> int:
+    """Write all queued SyncLog rows now. Returns the number written."""
+    batch = []
+    while True:
+        try:
+            batch.append(_log_queue.get_nowait())
+        except queue.Empty:
+            break
+    if not batch:
+        return 0
+    
+    try:
+        with database.atomic():
+            for rows in chunked(batch, 100):
+                SyncLog.insert_many(rows).execute()
+    except Exception as e:
+        logger.error(f"Failed to write {len(batch)} sync log entries: {e}")
+        return 0
+    return len(batch)
+
+
+def _drain_sync_logs():
+    """Drainer thread: flush queued SyncLog rows periodically, pruning old ones hourly."""
+    last_prune = 0.0
+    while True:
+        time.sleep(SYNC_LOG_FLUSH_INTERVAL)
+        if flush_sync_logs() and time.monotonic() - last_prune > 3600:
+            try:
+                SyncLog.delete().where(
+                    SyncLog.created_at < datetime.now() - SYNC_LOG_RETENTION
+                ).execute()
+                last_prune = time.monotonic()
+            except Exception as e:
+                logger.error(f"Failed to prune sync logs: {e}")
+
 
 class SyncService:
     """
@@ -28,21 +109,35 @@ class SyncService:
     
     def __init__(
         self,
-        sync_interval: int = 60,  # seconds
+        sync_interval: int = 60,  # seconds, initial list poll interval
+        min_interval: Optional[int] = None,  # seconds while the list keeps changing; sync_interval / 4
+        max_interval: Optional[int] = None,  # seconds, backoff ceiling when idle; sync_interval * 10
         detail_sync_interval: int = 300,  # seconds for detailed status
         max_experiments: int = 100,
+        status_workers: int = STATUS_WORKERS,  # concurrent `amlt status` calls
+        status_rate: Optional[float] = None,  # `amlt status` calls/sec; None shares STATUS_LIMITER
         on_update: Optional[Callable] = None,
     ):
         self.sync_interval = sync_interval
+        # The adaptive interval moves around the configured one
+        self.min_interval = min_interval if min_interval is not None else max(1, sync_interval // 4)
+        self.max_interval = max_interval if max_interval is not None else sync_interval * 10
         self.detail_sync_interval = detail_sync_interval
         self.max_experiments = max_experiments
+        self.status_workers = status_workers
+        self._status_limiter = RateLimiter(status_rate) if status_rate is not None else STATUS_LIMITER
         self.on_update = on_update
         
         self._running = False
         self._thread: Optional[threading.Thread] = None
-        self._last_sync = None
-        self._last_detail_sync = None
+        self._last_sync: Optional[datetime] = None
+        self._last_detail_sync_ts: Optional[float] = None  # time.monotonic()
         self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._last_list_sig: Optional[bytes] = None  # digest of the last `amlt list` result
+        self._list_state: Optional[int] = None  # hash of (name, status, job count) from the last list
+        self._row_states: Dict[str, Tuple] = {}  # experiment name -> last written list fields
+        self._list_changed = True
     
     def start(self):
         """Start the background sync thread."""
@@ -50,6 +145,7 @@ class SyncService:
             return
         
         self._running = True
+        self._stop_event.clear()
         self._thread = threading.Thread(target=self._sync_loop, daemon=True)
         self._thread.start()
         logger.info("Sync service started")
@@ -57,23 +153,32 @@ class SyncService:
     def stop(self):
         """Stop the background sync thread."""
         self._running = False
+        self._stop_event.set()
         if self._thread:
             self._thread.join(timeout=5)
+        flush_sync_logs()
         logger.info("Sync service stopped")
     
     def _sync_loop(self):
         """Main sync loop running in background thread."""
+        interval = self.sync_interval
         while self._running:
             try:
                 self.sync_list()
                 
+                # Poll faster while things change, back off while idle
+                if self._list_changed:
+                    interval = self.min_interval
+                else:
+                    interval = min(self.max_interval, interval * 1.5)
+                
                 # Check if we need to do detailed sync
                 if (
-                    self._last_detail_sync is None or
-                    (datetime.now() - self._last_detail_sync).seconds >= self.detail_sync_interval
+                    self._last_detail_sync_ts is None or
+                    time.monotonic() - self._last_detail_sync_ts >= self.detail_sync_interval
                 ):
                     self.sync_active_experiments()
-                    self._last_detail_sync = datetime.now()
+                    self._last_detail_sync_ts = time.monotonic()
                 
                 if self.on_update:
                     self.on_update()
@@ -81,11 +186,9 @@ class SyncService:
             except Exception as e:
                 logger.error(f"Sync error: {e}")
             
-            # Sleep in small increments to allow quick shutdown
-            for _ in range(self.sync_interval):
-                if not self._running:
-                    break
-                time.sleep(1)
+            # Jitter so several clients don't poll amlt in lockstep; stop() wakes us immediately
+            if self._stop_event.wait(interval + random.uniform(-0.2, 0.2) * interval):
+                break
     
     def sync_list(self, n_recent: int = None) -> bool:
         """
@@ -100,16 +203,76 @@ class SyncService:
         try:
             experiments = get_experiments(n_recent)
             
+            # Polling speeds up on status or job-count changes only: the relative "modified"
+            # strings of young experiments change every minute on their own
+            state = hash(tuple(sorted((e.name, e.status_type, e.status_count) for e in experiments)))
+            self._list_changed = state != self._list_state
+            self._list_state = state
+            
+            sig = hashlib.blake2b(
+                repr(sorted(
+                    (e.name, e.status_type, e.status_count, e.modified) for e in experiments
+                )).encode(),
+                digest_size=16,
+            ).digest()
+            if sig == self._last_list_sig:
+                self._last_sync = datetime.now()
+                logger.debug("List sync skipped: amlt list unchanged")
+                return True
+            
+            # Only write experiments whose list fields differ from what we last wrote
+            states = {
+                e.name: (
+                    e.status_type, e.status_count, e.cluster, e.flags, e.size,
+                    e.job_url, e.description, e.modified,
+                )
+                for e in experiments
+            }
+            changed = [e for e in experiments if self._row_states.get(e.name) != states[e.name]]
+            
+            now = datetime.now()
+            rows = [
+                {
+                    'name': e.name,
+                    'status': e.status_type.lower(),
+                    # Bulk inserts bypass Experiment.save(), so normalize here
+                    'status_normalized': normalize_experiment_status(e.status_type),
+                    'job_count': e.status_count,
+                    'cluster': e.cluster,
+                    'flags': e.flags,
+                    'size': e.size,
+                    'job_url': e.job_url,
+                    'description': e.description,
+                    'modified_at_str': e.modified,
+                    'created_at': now,
+                    'updated_at': now,
+                }
+                for e in changed
+            ]
+            
             with self._lock:
                 with database.atomic():
-                    for exp_info in experiments:
-                        self._upsert_experiment(exp_info)
+                    # Batched to stay under SQLite's bound-variable limit
+                    for batch in chunked(rows, 50):
+                        Experiment.insert_many(batch).on_conflict(
+                            conflict_target=[Experiment.name],
+                            preserve=[
+                                Experiment.status, Experiment.status_normalized,
+                                Experiment.job_count, Experiment.cluster,
+                                Experiment.flags, Experiment.size, Experiment.job_url,
+                                Experiment.description, Experiment.modified_at_str,
+                                Experiment.updated_at,
+                            ],
+                        ).execute()
+            
+            self._row_states.update(states)
+            self._last_list_sig = sig
             
             duration = int(time.time() - start_time)
-            SyncLog.create(
+            queue_sync_log(
                 sync_type="list",
                 success=True,
-                message=f"Synced {len(experiments)} experiments",
+                message=f"Synced {len(experiments)} experiments ({len(changed)} changed)",
                 duration_seconds=duration
             )
             
@@ -118,7 +281,7 @@ class SyncService:
             return True
             
         except Exception as e:
-            SyncLog.create(
+            queue_sync_log(
                 sync_type="list",
                 success=False,
                 message=str(e)
@@ -126,15 +289,19 @@ class SyncService:
             logger.error(f"List sync failed: {e}")
             return False
     
-    def sync_experiment_status(self, exp_name: str) -> bool:
+    def sync_experiment_status(
+        self, exp_name: str, detail: Optional[ExperimentDetail] = None
+    ) -> bool:
         """
         Sync detailed status for a specific experiment.
-        This fetches individual job status within the experiment.
+        This fetches individual job status within the experiment,
+        unless an already fetched detail is passed in.
         """
         start_time = time.time()
         
         try:
-            detail = get_experiment_status(exp_name)
+            if detail is None:
+                detail = self._fetch_status(exp_name)
             if not detail:
                 return False
             
@@ -143,7 +310,7 @@ class SyncService:
                     self._update_experiment_detail(exp_name, detail)
             
             duration = int(time.time() - start_time)
-            SyncLog.create(
+            queue_sync_log(
                 sync_type="status",
                 experiment_name=exp_name,
                 success=True,
@@ -155,7 +322,7 @@ class SyncService:
             return True
             
         except Exception as e:
-            SyncLog.create(
+            queue_sync_log(
                 sync_type="status",
                 experiment_name=exp_name,
                 success=False,
@@ -180,10 +347,19 @@ class SyncService:
                 (Experiment.detail_fetched == False)
             ).order_by(Experiment.updated_at.desc()).limit(20)
             
-            for exp in experiments:
-                if self.sync_experiment_status(exp.name):
-                    count += 1
-                time.sleep(0.5)  # Rate limiting
+            # Fetch in parallel (bounded to go easy on amlt), write on this thread
+            names = [exp.name for exp in experiments]
+            with ThreadPoolExecutor(max_workers=self.status_workers) as pool:
+                futures = {pool.submit(self._fetch_status, name): name for name in names}
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        detail = future.result()
+                    except Exception as e:
+                        logger.error(f"Status fetch failed for {name}: {e}")
+                        continue
+                    if detail and self.sync_experiment_status(name, detail):
+                        count += 1
             
             return count
             
@@ -191,6 +367,11 @@ class SyncService:
             logger.error(f"Active sync failed: {e}")
             return count
     
+    def _fetch_status(self, exp_name: str) -> Optional[ExperimentDetail]:
+        """Fetch an experiment's status, within the status rate limit."""
+        self._status_limiter.acquire()
+        return get_experiment_status(exp_name)
+    
     def force_sync_all(self) -> bool:
         """Force a full sync of all experiments."""
         success = self.sync_list()
@@ -202,88 +383,80 @@ class SyncService:
             
             for exp in experiments:
                 self.sync_experiment_status(exp.name)
-                time.sleep(0.3)
         
         return success
     
-    def _upsert_experiment(self, exp_info: ExperimentInfo):
-        """Insert or update an experiment from list info."""
-        exp, created = Experiment.get_or_create(
-            name=exp_info.name,
-            defaults={
-                'status': exp_info.status_type.lower(),
-                'job_count': exp_info.status_count,
-                'cluster': exp_info.cluster,
-                'flags': exp_info.flags,
-                'size': exp_info.size,
-                'job_url': exp_info.job_url,
-                'description': exp_info.description,
-                'modified_at_str': exp_info.modified,
-            }
-        )
-        
-        if not created:
-            # Update existing experiment
-            exp.status = exp_info.status_type.lower()
-            exp.job_count = exp_info.status_count
-            exp.cluster = exp_info.cluster
-            exp.flags = exp_info.flags
-            exp.size = exp_info.size
-            exp.job_url = exp_info.job_url
-            exp.description = exp_info.description
-            exp.modified_at_str = exp_info.modified
-            exp.save()
-    
     def _update_experiment_detail(self, exp_name: str, detail: ExperimentDetail):
         """Update experiment with detailed status info."""
         try:
             exp = Experiment.get(Experiment.name == exp_name)
         except Experiment.DoesNotExist:
-            # Create new experiment
-            exp = Experiment.create(
-                name=exp_name,
-                status='unknown',
-            )
+            # New experiment, inserted by the save below
+            exp = Experiment(name=exp_name, status='unknown')
         
         # Update experiment info
-        exp.service = detail.service
-        exp.cluster = detail.cluster
-        exp.workspace = detail.workspace
-        exp.job_count = detail.n_jobs
-        exp.description = detail.description
-        exp.pass_count = detail.pass_count
-        exp.fail_count = detail.fail_count
-        exp.running_count = detail.running_count
-        exp.queued_count = detail.queued_count
-        exp.detail_fetched = True
+        fields = {
+            'service': detail.service,
+            'cluster': detail.cluster,
+            'workspace': detail.workspace,
+            'job_count': detail.n_jobs,
+            'description': detail.description,
+            'pass_count': detail.pass_count,
+            'fail_count': detail.fail_count,
+            'running_count': detail.running_count,
+            'queued_count': detail.queued_count,
+            'detail_fetched': True,
+        }
         
         # Determine overall status from counts
         if detail.running_count > 0:
-            exp.status = 'running'
+            fields['status'] = 'running'
         elif detail.queued_count > 0:
-            exp.status = 'queued'
+            fields['status'] = 'queued'
         elif detail.fail_count > 0:
-            exp.status = 'fail'
+            fields['status'] = 'fail'
         elif detail.pass_count > 0 and detail.pass_count == detail.n_jobs:
-            exp.status = 'pass'
+            fields['status'] = 'pass'
         
-        exp.save()
+        # Skip the UPDATE entirely when nothing changed
+        changed = {k: v for k, v in fields.items() if getattr(exp, k) != v}
+        if changed or exp.id is None:
+            for k, v in changed.items():
+                setattr(exp, k, v)
+            exp.save()
         
-        # Update jobs
-        Job.delete().where(Job.experiment == exp).execute()
+        # Update jobs - only write rows that were added, changed or removed
+        existing = {j.job_index: j for j in exp.jobs}
+        to_create, to_update = [], []
+        now = datetime.now()
         
         for job_info in detail.jobs:
-            Job.create(
-                experiment=exp,
-                job_index=job_info.index,
-                job_name=job_info.name,
-                status=job_info.status.lower(),
-                duration=job_info.duration,
-                size=job_info.size,
-                flags=job_info.flags,
-                portal_url=job_info.portal_url,
-                submitted_at_str=job_info.submitted,
-            )
+            values = {
+                'job_name': job_info.name,
+                'status': job_info.status.lower(),
+                'duration': job_info.duration,
+                'size': job_info.size,
+                'flags': job_info.flags,
+                'portal_url': job_info.portal_url,
+                'submitted_at_str': job_info.submitted,
+            }
+            job = existing.pop(job_info.index, None)
+            if job is None:
+                to_create.append(Job(experiment=exp, job_index=job_info.index, **values))
+            elif any(getattr(job, k) != v for k, v in values.items()):
+                for k, v in values.items():
+                    setattr(job, k, v)
+                job.updated_at = now
+                to_update.append(job)
+        
+        if to_create:
+            Job.bulk_create(to_create, batch_size=100)
+        if to_update:
+            Job.bulk_update(to_update, fields=JOB_SYNC_FIELDS, batch_size=100)
+        if existing:
+            Job.delete().where(
+                (Job.experiment == exp) & Job.job_index.in_(list(existing))
+            ).execute()
     
     @property
     def last_sync_time(self) -> Optional[datetime]:
@@ -4,13 +4,17 @@ Uses Rich library for beautiful terminal output.
 """
 
 import os
+import queue
 import sys
-from datetime import datetime
-from typing import List, Optional
+import threading
+import time
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
+from rich.markup import escape
 from rich.text import Text
 from rich.live import Live
 from rich.layout import Layout
@@ -23,6 +27,68 @@ from .models import Experiment, Job, init_database, database
 console = Console()
 
 
+class _ConsoleWriter:
+    """
+    File-like stream that hands writes to a daemon thread, so rendering never blocks
+    on a slow terminal (e.g. over SSH). Pending chunks are coalesced into one write;
+    the queue is bounded so a stalled terminal applies backpressure instead of
+    growing memory.
+    """
+    
+    def __init__(self, stream=None, maxsize: int = 1000):
+        self._stream = stream or sys.__stdout__
+        self._queue: "queue.Queue[str]" = queue.Queue(maxsize)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    @property
+    def encoding(self) -> str:
+        return getattr(self._stream, 'encoding', None) or 'utf-8'
+    
+    def write(self, s: str) -> int:
+        self._queue.put(s)
+        return len(s)
+    
+    def flush(self):
+        """No-op: the writer thread flushes after every write. Use drain() to wait."""
+    
+    def drain(self):
+        """Block until everything written so far has reached the stream."""
+        self._queue.join()
+    
+    def isatty(self) -> bool:
+        return self._stream.isatty()
+    
+    def fileno(self) -> int:
+        return self._stream.fileno()
+    
+    def _run(self):
+        while True:
+            chunks = [self._queue.get()]
+            while True:
+                try:
+                    chunks.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._stream.write("".join(chunks))
+                self._stream.flush()
+            except Exception:
+                pass
+            finally:
+                for _ in chunks:
+                    self._queue.task_done()
+
+
+def create_live_console() -> Console:
+    """
+    Console for redraw loops (rich Live): output goes through a background writer.
+    Call console.file.drain() after the loop, before printing with the main console.
+    Not for prompts or subprocess output, which must stay ordered with direct writes.
+    """
+    return Console(file=_ConsoleWriter())
+
+
 # Status colors
 STATUS_COLORS = {
     'pass': 'green',
@@ -47,18 +113,21 @@ STATUS_ICONS = {
 }
 
 
+@lru_cache(maxsize=32)
 def get_status_style(status: str) -> str:
     """Get the color style for a status."""
     return STATUS_COLORS.get(status.lower(), 'white')
 
 
+@lru_cache(maxsize=32)
 def get_status_icon(status: str) -> str:
     """Get the icon for a status."""
     return STATUS_ICONS.get(status.lower(), '?')
 
 
-def format_status(status: str, count: Optional[int] = None) -> Text:
-    """Format status with color and icon."""
+@lru_cache(maxsize=256)
+def _format_status_cached(status: str, count: Optional[int]) -> Tuple[str, str]:
+    """(text, style) for format_status; cached, as only a few distinct inputs occur."""
     icon = get_status_icon(status)
     color = get_status_style(status)
     
@@ -67,9 +136,31 @@ def format_status(status: str, count: Optional[int] = None) -> Text:
     else:
         text = f"{icon} {status.capitalize()}"
     
+    return text, color
+
+
+def format_status(status: str, count: Optional[int] = None) -> Text:
+    """Format status with color and icon."""
+    # A fresh Text per call: Text is mutable and callers may append to it
+    text, color = _format_status_cached(status, count)
     return Text(text, style=color)
 
 
+def _build_status_text(exp: Experiment) -> Optional[Text]:
+    """Per-state job counts like '✓3 ●2' as styled Text (no markup to parse), or None if all zero."""
+    parts = [
+        Text(f"{icon}{n}", style=style)
+        for icon, style, n in (
+            ("✓", "green", exp.pass_count),
+            ("●", "cyan", exp.running_count),
+            ("◌", "yellow", exp.queued_count),
+            ("✗", "red", exp.fail_count),
+        )
+        if n > 0
+    ]
+    return Text(" ").join(parts) if parts else None
+
+
 def create_experiments_table(
     experiments: List[Experiment],
     show_jobs: bool = False,
@@ -85,6 +176,8 @@ def create_experiments_table(
         border_style="dim",
         row_styles=["", "dim"],
         expand=True,
+        show_lines=False,
+        padding=(0, 1),
     )
     
     # Columns
@@ -102,20 +195,12 @@ def create_experiments_table(
     for idx, exp in enumerate(experiments, 1):
         # Build status cell with counts
         if exp.detail_fetched:
-            status_parts = []
-            if exp.pass_count > 0:
-                status_parts.append(f"[green]✓{exp.pass_count}[/]")
-            if exp.running_count > 0:
-                status_parts.append(f"[cyan]●{exp.running_count}[/]")
-            if exp.queued_count > 0:
-                status_parts.append(f"[yellow]◌{exp.queued_count}[/]")
-            if exp.fail_count > 0:
-                status_parts.append(f"[red]✗{exp.fail_count}[/]")
-            status_str = " ".join(status_parts) if status_parts else format_status(exp.status)
+            status_str = _build_status_text(exp) or format_status(exp.status)
         else:
             status_str = format_status(exp.status, exp.job_count)
         
-        row = [
+        # Every cell is already a str or Text, so Rich has no fallbacks to resolve
+        row = (
             str(idx),
             exp.name,
             status_str,
@@ -123,12 +208,12 @@ def create_experiments_table(
             exp.cluster or "-",
             exp.modified_at_str or "-",
             exp.description or "-",
-        ]
-        
-        if not compact:
-            row.append(exp.job_url or "-")
+        )
         
-        table.add_row(*row)
+        if compact:
+            table.add_row(*row)
+        else:
+            table.add_row(*row, exp.job_url or "-")
     
     return table
 
@@ -136,7 +221,16 @@ def create_experiments_table(
 def create_jobs_table(experiment: Experiment) -> Table:
     """Create a Rich table for jobs within an experiment."""
     
-    jobs = Job.select().where(Job.experiment == experiment).order_by(Job.job_index)
+    # Plain tuples in one query: no model instances are built for the render loop
+    jobs = list(
+        Job.select(
+            Job.job_index, Job.job_name, Job.status, Job.duration,
+            Job.size, Job.submitted_at_str, Job.flags,
+        )
+        .where(Job.experiment == experiment)
+        .order_by(Job.job_index)
+        .tuples()
+    )
     
     table = Table(
         title=f"🔧 Jobs in [bold]{experiment.name}[/]",
@@ -155,17 +249,15 @@ def create_jobs_table(experiment: Experiment) -> Table:
     table.add_column("Submitted", style="yellow", width=12)
     table.add_column("Flags", style="dim", width=10)
     
-    for job in jobs:
-        status_str = format_status(job.status)
-        
+    for job_index, job_name, status, duration, size, submitted, flags in jobs:
         table.add_row(
-            f":{job.job_index}",
-            job.job_name,
-            status_str,
-            job.duration or "-",
-            job.size or "-",
-            job.submitted_at_str or "-",
-            job.flags or "-",
+            f":{job_index}",
+            job_name,
+            format_status(status),
+            duration or "-",
+            size or "-",
+            submitted or "-",
+            flags or "-",
         )
     
     return table
@@ -175,32 +267,41 @@ def create_summary_panel(experiments: List[Experiment]) -> Panel:
     """Create a summary panel with overall statistics."""
     
     total = len(experiments)
-    running = sum(1 for e in experiments if e.status == 'running')
-    queued = sum(1 for e in experiments if e.status in ('queued', 'prep'))
-    passed = sum(1 for e in experiments if e.status == 'pass')
-    failed = sum(1 for e in experiments if e.status in ('fail', 'failed'))
-    
-    # Total jobs
-    total_jobs = sum(e.job_count for e in experiments)
-    pass_jobs = sum(e.pass_count for e in experiments)
-    run_jobs = sum(e.running_count for e in experiments)
-    queue_jobs = sum(e.queued_count for e in experiments)
-    fail_jobs = sum(e.fail_count for e in experiments)
-    
-    summary = Text()
-    summary.append("📊 Summary\n\n", style="bold cyan")
-    
-    summary.append(f"Experiments: {total}\n", style="white")
-    summary.append(f"  [green]✓ Pass: {passed}[/]  ")
-    summary.append(f"[cyan]● Running: {running}[/]  ")
-    summary.append(f"[yellow]◌ Queued: {queued}[/]  ")
-    summary.append(f"[red]✗ Failed: {failed}[/]\n\n")
-    
-    summary.append(f"Total Jobs: {total_jobs}\n", style="white")
-    summary.append(f"  [green]✓ {pass_jobs}[/]  ")
-    summary.append(f"[cyan]● {run_jobs}[/]  ")
-    summary.append(f"[yellow]◌ {queue_jobs}[/]  ")
-    summary.append(f"[red]✗ {fail_jobs}[/]")
+    running = queued = passed = failed = 0
+    total_jobs = pass_jobs = run_jobs = queue_jobs = fail_jobs = 0
+    
+    # One pass for both the experiment and the job counts
+    for e in experiments:
+        status = e.status
+        if status == 'running':
+            running += 1
+        elif status in ('queued', 'prep'):
+            queued += 1
+        elif status == 'pass':
+            passed += 1
+        elif status in ('fail', 'failed'):
+            failed += 1
+        
+        total_jobs += e.job_count
+        pass_jobs += e.pass_count
+        run_jobs += e.running_count
+        queue_jobs += e.queued_count
+        fail_jobs += e.fail_count
+    
+    # Built as one markup string and parsed once, rather than appended piece by piece
+    summary = Text.from_markup(
+        "[bold cyan]📊 Summary[/]\n\n"
+        f"[white]Experiments: {total}[/]\n"
+        f"  [green]✓ Pass: {passed}[/]  "
+        f"[cyan]● Running: {running}[/]  "
+        f"[yellow]◌ Queued: {queued}[/]  "
+        f"[red]✗ Failed: {failed}[/]\n\n"
+        f"[white]Total Jobs: {total_jobs}[/]\n"
+        f"  [green]✓ {pass_jobs}[/]  "
+        f"[cyan]● {run_jobs}[/]  "
+        f"[yellow]◌ {queue_jobs}[/]  "
+        f"[red]✗ {fail_jobs}[/]"
+    )
     
     return Panel(summary, border_style="cyan", box=box.ROUNDED)
 
@@ -208,39 +309,33 @@ def create_summary_panel(experiments: List[Experiment]) -> Panel:
 def create_experiment_detail_panel(experiment: Experiment) -> Panel:
     """Create a detailed view panel for an experiment."""
     
-    content = Text()
-    content.append(f"📦 {experiment.name}\n\n", style="bold cyan")
-    
-    content.append("Status: ", style="bold")
-    content.append(format_status(experiment.status))
-    content.append("\n")
-    
-    content.append("Cluster: ", style="bold")
-    content.append(f"{experiment.cluster or 'N/A'}\n", style="cyan")
-    
-    content.append("Workspace: ", style="bold")
-    content.append(f"{experiment.workspace or 'N/A'}\n")
-    
-    content.append("Service: ", style="bold")
-    content.append(f"{experiment.service or 'N/A'}\n")
-    
-    content.append("Flags: ", style="bold")
-    content.append(f"{experiment.flags or 'N/A'}\n")
+    status_text, status_color = _format_status_cached(experiment.status, None)
     
-    content.append("\nDescription: ", style="bold")
-    content.append(f"{experiment.description or 'No description'}\n", style="dim")
+    # One markup string, parsed once; values from amlt are escaped so '[' can't become markup
+    parts = [
+        f"[bold cyan]📦 {escape(experiment.name)}[/]\n\n",
+        f"[bold]Status: [/][{status_color}]{escape(status_text)}[/]\n",
+        f"[bold]Cluster: [/][cyan]{escape(experiment.cluster or 'N/A')}[/]\n",
+        f"[bold]Workspace: [/]{escape(experiment.workspace or 'N/A')}\n",
+        f"[bold]Service: [/]{escape(experiment.service or 'N/A')}\n",
+        f"[bold]Flags: [/]{escape(experiment.flags or 'N/A')}\n",
+        f"\n[bold]Description: [/][dim]{escape(experiment.description or 'No description')}[/]\n",
+    ]
     
     if experiment.job_url:
-        content.append("\nURL: ", style="bold")
-        content.append(experiment.job_url, style="blue underline")
+        parts.append(f"\n[bold]URL: [/][blue underline]{escape(experiment.job_url)}[/]")
     
     # Job counts
     if experiment.detail_fetched:
-        content.append("\n\nJob Status:\n", style="bold")
-        content.append(f"  [green]✓ Pass: {experiment.pass_count}[/]\n")
-        content.append(f"  [cyan]● Running: {experiment.running_count}[/]\n")
-        content.append(f"  [yellow]◌ Queued: {experiment.queued_count}[/]\n")
-        content.append(f"  [red]✗ Failed: {experiment.fail_count}[/]\n")
+        parts.append(
+            "\n\n[bold]Job Status:[/]\n"
+            f"  [green]✓ Pass: {experiment.pass_count}[/]\n"
+            f"  [cyan]● Running: {experiment.running_count}[/]\n"
+            f"  [yellow]◌ Queued: {experiment.queued_count}[/]\n"
+            f"  [red]✗ Failed: {experiment.fail_count}[/]\n"
+        )
+    
+    content = Text.from_markup("".join(parts))
     
     return Panel(content, border_style="cyan", box=box.ROUNDED)
 
@@ -251,26 +346,28 @@ def print_experiments(
     compact: bool = False,
 ):
     """Print experiments list."""
+    table = create_experiments_table(experiments, compact=compact)
+    # One render pass and one terminal write for the whole block
     if show_summary and experiments:
-        console.print(create_summary_panel(experiments))
-        console.print()
-    
-    console.print(create_experiments_table(experiments, compact=compact))
+        console.print(Group(create_summary_panel(experiments), "", table))
+    else:
+        console.print(table)
 
 
-def print_experiment_detail(experiment: Experiment):
-    """Print detailed view of an experiment."""
+def print_experiment_detail(experiment: Experiment, include_jobs: bool = True):
+    """Print detailed view of an experiment. The jobs table (and its query) is skipped unless include_jobs."""
     console.print(create_experiment_detail_panel(experiment))
-    console.print()
-    console.print(create_jobs_table(experiment))
+    if include_jobs:
+        console.print()
+        console.print(create_jobs_table(experiment))
 
 
-def print_status_bar(
-    last_sync: Optional[datetime],
+def create_status_bar(
+    last_sync: Optional[float],
     is_syncing: bool = False,
     sync_interval: int = 60,
-):
-    """Print a status bar showing sync status."""
+) -> Text:
+    """Create a status bar showing sync status. last_sync is a time.monotonic() timestamp."""
     text = Text()
     
     if is_syncing:
@@ -278,23 +375,37 @@ def print_status_bar(
     else:
         text.append("✓ Synced", style="green")
     
-    if last_sync:
-        elapsed = (datetime.now() - last_sync).seconds
+    if last_sync is not None:
+        elapsed = int(time.monotonic() - last_sync)
         text.append(f" ({elapsed}s ago)", style="dim")
     
     text.append(f"  |  Refresh: {sync_interval}s", style="dim")
     text.append("  |  [q]uit [r]efresh [/]filter [s]ync", style="dim")
     
-    console.print(text)
+    return text
+
+
+def print_status_bar(
+    last_sync: Optional[float],
+    is_syncing: bool = False,
+    sync_interval: int = 60,
+):
+    """Print a status bar showing sync status. last_sync is a time.monotonic() timestamp."""
+    console.print(create_status_bar(last_sync, is_syncing, sync_interval))
 
 
 def clear_screen():
     """Clear the terminal screen."""
-    os.system('clear' if os.name == 'posix' else 'cls')
+    if os.name == 'nt':
+        os.system('cls')
+        return
+    # Escape sequence written directly: no shell fork per redraw
+    sys.stdout.write('\x1b[2J\x1b[H')
+    sys.stdout.flush()
 
 
-def print_header():
-    """Print the application header."""
+def _build_header() -> Text:
+    """Build the application header."""
     header = Text()
     header.append("╔═══════════════════════════════════════════════════════════╗\n", style="cyan")
     header.append("║  ", style="cyan")
@@ -309,5 +420,19 @@ def print_header():
     header.append("  |  AMLT Job Manager", style="cyan")
     header.append("               ║\n", style="cyan")
     header.append("╚═══════════════════════════════════════════════════════════╝", style="cyan")
-    console.print(header)
+    return header
+
+
+# The header is static, so style it once at import
+_HEADER_TEXT = _build_header()
+
+
+def create_header() -> Text:
+    """Get the application header. The Text is shared; copy it before modifying."""
+    return _HEADER_TEXT
+
+
+def print_header():
+    """Print the application header."""
+    console.print(_HEADER_TEXT)
     console.print()
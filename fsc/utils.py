@@ -4,9 +4,11 @@ FSC - Utility functions and shared constants.
 
 from __future__ import annotations
 
+import os
 import re
-from datetime import datetime
-from typing import Dict
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional
 
 
 # Status styling - icons, colors, and display names
@@ -22,6 +24,28 @@ STATUS_DISPLAY = {
     'unknown': ('?', 'dim', 'Unknown'),
 }
 
+# Status -> list bucket used when grouping experiments/jobs into tabs
+STATUS_BUCKET = {
+    'running': 'running',
+    'queued': 'queued',
+    'prep': 'queued',
+    'pass': 'pass',
+    'fail': 'fail',
+    'failed': 'fail',
+    'killed': 'killed',
+}
+
+_TIME_AGO_RE = re.compile(r'(\d+)\s*([mhdw])\s*ago')
+_TIME_UNIT_MINUTES = {'m': 1, 'h': 60, 'd': 60 * 24, 'w': 60 * 24 * 7}
+
+# Matches patterns like "Running (12)" or "Pass (4)"
+_COMPOUND_STATUS_RE = re.compile(r'(\w+)\s*\((\d+)\)')
+
+# Priority for get_primary_status: running > queued > prep > fail > killed > pass
+_PRIORITY_RANK = {
+    s: rank for rank, s in enumerate(['running', 'queued', 'prep', 'fail', 'failed', 'killed', 'pass'])
+}
+
 
 def parse_time_ago(s: str) -> int:
     """
@@ -32,17 +56,9 @@ def parse_time_ago(s: str) -> int:
     if not s:
         return 999999
     s = s.strip().lower()
-    match = re.match(r'(\d+)\s*(m|h|d|w)\s*ago', s)
+    match = _TIME_AGO_RE.match(s)
     if match:
-        val, unit = int(match.group(1)), match.group(2)
-        if unit == 'm':
-            return val
-        elif unit == 'h':
-            return val * 60
-        elif unit == 'd':
-            return val * 60 * 24
-        elif unit == 'w':
-            return val * 60 * 24 * 7
+        return int(match.group(1)) * _TIME_UNIT_MINUTES[match.group(2)]
     return 999999
 
 
@@ -52,9 +68,7 @@ def parse_compound_status(status_str: str) -> Dict[str, int]:
     Returns dict of status -> count
     """
     result = {}
-    # Match patterns like "Running (12)" or "Pass (4)"
-    pattern = r'(\w+)\s*\((\d+)\)'
-    for match in re.finditer(pattern, status_str):
+    for match in _COMPOUND_STATUS_RE.finditer(status_str):
         status_type = match.group(1).lower()
         count = int(match.group(2))
         result[status_type] = count
@@ -63,31 +77,58 @@ def parse_compound_status(status_str: str) -> Dict[str, int]:
 
 def get_primary_status(status_str: str) -> str:
     """Get the primary status from a compound status string."""
+    # Plain statuses like "running" have no counts to parse
+    if '(' not in status_str:
+        return status_str.lower()
     status_counts = parse_compound_status(status_str)
     if not status_counts:
         return status_str.lower()
     
-    # Priority: running > queued > prep > fail > killed > pass
-    priority = ['running', 'queued', 'prep', 'fail', 'failed', 'killed', 'pass']
-    for s in priority:
-        if s in status_counts:
-            return s
-    return list(status_counts.keys())[0]
-
-
-def format_time_ago(timestamp: float) -> str:
-    """Format timestamp as relative time (e.g., '5m ago', '2h ago')."""
-    now = datetime.now().timestamp()
-    diff = now - timestamp
+    # Lowest rank wins; unranked statuses fall back to the first one listed
+    return min(status_counts, key=lambda s: _PRIORITY_RANK.get(s, len(_PRIORITY_RANK)))
+
+
+def format_time_ago(timestamp: float, now: Optional[float] = None) -> str:
+    """
+    Format timestamp as relative time (e.g., '5m ago', '2h ago').
+    Callers formatting many timestamps can pass one `now` for all of them.
+    """
+    if now is None:
+        now = time.time()
+    diff = int(now - timestamp)
     
     if diff < 60:
-        return f"{int(diff)}s ago"
+        return f"{diff}s ago"
     elif diff < 3600:
-        return f"{int(diff / 60)}m ago"
+        return f"{diff // 60}m ago"
     elif diff < 86400:
-        return f"{int(diff / 3600)}h ago"
+        return f"{diff // 3600}h ago"
     else:
-        return f"{int(diff / 86400)}d ago"
+        return f"{diff // 86400}d ago"
+
+
+def tail_lines(path: str, n: int = 200, chunk_size: int = 1 << 16) -> List[str]:
+    """
+    Read the last n lines of a file by seeking backwards from the end.
+    Only the tail is read from disk, so cost does not grow with file size.
+    Bytes are decoded once as UTF-8 with replacement, so binary noise in logs never raises.
+    """
+    # Unbuffered: reads are already chunked here, a BufferedReader would only add a copy
+    with open(path, 'rb', buffering=0) as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        chunks = []
+        newlines = 0
+        while pos > 0 and newlines <= n:
+            read_size = min(chunk_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            chunk = f.read(read_size)
+            chunks.append(chunk)
+            newlines += chunk.count(b'\n')
+    
+    data = b''.join(reversed(chunks))
+    return data.decode('utf-8', errors='replace').splitlines()[-n:]
 
 
 def get_amlt_output_dir() -> str:
@@ -96,6 +137,7 @@ def get_amlt_output_dir() -> str:
     return get_config_cache().get_output_dir()
 
 
+@lru_cache(maxsize=32)
 def normalize_status(status: str) -> str:
     """Normalize status string to standard form."""
     status = status.lower().split()[0] if status else ''
@@ -4,7 +4,9 @@ Custom widgets for FSC TUI application.
 
 from __future__ import annotations
 
-from typing import List
+from collections import deque
+from functools import lru_cache
+from typing import Deque, Optional
 
 from textual.app import ComposeResult
 from textual.containers import Container
@@ -16,6 +18,41 @@ from ..data import ExpData, JobData, StatusChange
 from ..utils import STATUS_DISPLAY
 
 
+def _trunc(s: str, max_len: int) -> str:
+    """Return s unchanged if it fits in max_len, else cut it to max_len with a '..' suffix."""
+    return s if len(s) <= max_len else s[:max_len - 2] + ".."
+
+
+# (color, icon) for each count cell, in _status_cells argument order
+_STATUS_SPECS = (
+    ('cyan', '●'),
+    ('yellow', '◌'),
+    ('green', '✓'),
+    ('red', '✗'),
+    ('magenta', '⊘'),
+)
+
+
+@lru_cache(maxsize=4096)
+def _status_cells(
+    running: int, queued: int, passed: int, failed: int, killed: int, job_count: int, status: str
+) -> tuple[str, int]:
+    """Status cell markup and display width for an experiment row; cached by counts."""
+    if job_count > 1:
+        counts = (running, queued, passed, failed, killed)
+        if not any(counts):
+            return f"[dim]{job_count} jobs[/]", len(str(job_count)) + 5
+        cells = tuple(
+            (color, f"{icon}{n}") for (color, icon), n in zip(_STATUS_SPECS, counts) if n > 0
+        )
+        markup = " ".join(f"[{color}]{cell}[/]" for color, cell in cells)
+        # Each cell is one space apart on screen
+        return markup, sum(len(cell) for _, cell in cells) + len(cells) - 1
+    else:
+        icon, color, _ = STATUS_DISPLAY.get(status, ('?', 'white', status))
+        return f"[{color}]{icon}[/]", 1
+
+
 class ExperimentListItem(ListItem):
     """A list item representing an experiment."""
     
@@ -27,71 +64,67 @@ class ExperimentListItem(ListItem):
     COL_TIME = 8
     COL_TAG = 12
     
+    # Row layout with the column widths baked in, so no format spec is built per row:
+    # name | status | cluster | flags | modified
+    _ROW_TEMPLATE = (
+        " [bold]{name:<%d}[/] "
+        "{status}{pad} "
+        "[dim]{cluster:<%d}[/] "
+        "[cyan]{flags:<%d}[/] "
+        "[yellow]{modified:>%d}[/]"
+    ) % (COL_NAME, COL_CLUSTER, COL_FLAGS, COL_TIME)
+    
     def __init__(self, exp: ExpData, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.exp = exp
+        self._content = ""
+        self._label: Optional[Static] = None
+    
+    def update_from(self, exp: ExpData):
+        """Point this row at new experiment data, re-rendering only if the text changed."""
+        self.exp = exp
+        content = self._row_markup(exp)
+        if content != self._content:
+            self._content = content
+            if self._label is not None:
+                self._label.update(content)
     
     def _build_status_str(self, exp: ExpData) -> tuple[str, int]:
         """Build status string and return (formatted_str, display_width)."""
-        if exp.job_count > 1:
-            parts = []
-            raw_parts = []  # For calculating width
-            if exp.running_count > 0:
-                parts.append(f"[cyan]●{exp.running_count}[/]")
-                raw_parts.append(f"●{exp.running_count}")
-            if exp.queued_count > 0:
-                parts.append(f"[yellow]◌{exp.queued_count}[/]")
-                raw_parts.append(f"◌{exp.queued_count}")
-            if exp.pass_count > 0:
-                parts.append(f"[green]✓{exp.pass_count}[/]")
-                raw_parts.append(f"✓{exp.pass_count}")
-            if exp.fail_count > 0:
-                parts.append(f"[red]✗{exp.fail_count}[/]")
-                raw_parts.append(f"✗{exp.fail_count}")
-            if exp.killed_count > 0:
-                parts.append(f"[magenta]⊘{exp.killed_count}[/]")
-                raw_parts.append(f"⊘{exp.killed_count}")
-            if parts:
-                return " ".join(parts), len(" ".join(raw_parts))
-            else:
-                return f"[dim]{exp.job_count} jobs[/]", len(f"{exp.job_count} jobs")
-        else:
-            icon, color, _ = STATUS_DISPLAY.get(exp.status, ('?', 'white', exp.status))
-            return f"[{color}]{icon}[/]", 1
+        return _status_cells(
+            exp.running_count, exp.queued_count, exp.pass_count, exp.fail_count,
+            exp.killed_count, exp.job_count, exp.status,
+        )
     
     def compose(self) -> ComposeResult:
-        exp = self.exp
-        
+        self._content = self._row_markup(self.exp)
+        self._label = Static(self._content)
+        yield self._label
+    
+    def _row_markup(self, exp: ExpData) -> str:
+        """Build the markup for one experiment row."""
         # Build status display
         status_str, status_width = self._build_status_str(exp)
         
-        # Truncate long names
-        name = exp.name[:self.COL_NAME-2] + ".." if len(exp.name) > self.COL_NAME else exp.name
-        cluster = exp.cluster[:self.COL_CLUSTER-2] + ".." if len(exp.cluster) > self.COL_CLUSTER else exp.cluster
-        
-        # Format flags
-        flags = exp.flags[:self.COL_FLAGS-2] + ".." if len(exp.flags) > self.COL_FLAGS else exp.flags
-        
-        # Format tag (truncate if too long)
-        tag = exp.tag[:self.COL_TAG-2] + ".." if len(exp.tag) > self.COL_TAG else exp.tag
+        # Truncate long values to their columns
+        name = _trunc(exp.name, self.COL_NAME)
+        cluster = _trunc(exp.cluster, self.COL_CLUSTER)
+        flags = _trunc(exp.flags, self.COL_FLAGS)
+        tag = _trunc(exp.tag, self.COL_TAG)
         
         # Pad status with spaces to align next column
         status_padding = " " * (self.COL_STATUS - status_width)
         
-        # Format with fixed columns: name | status | cluster | flags | modified | tag
-        content = (
-            f" [bold]{name:<{self.COL_NAME}}[/] "
-            f"{status_str}{status_padding} "
-            f"[dim]{cluster:<{self.COL_CLUSTER}}[/] "
-            f"[cyan]{flags:<{self.COL_FLAGS}}[/] "
-            f"[yellow]{exp.modified:>{self.COL_TIME}}[/]"
+        content = self._ROW_TEMPLATE.format(
+            name=name, status=status_str, pad=status_padding,
+            cluster=cluster, flags=flags, modified=exp.modified,
         )
         
         # Add tag if present
         if tag:
             content += f"  [bold magenta]#{tag}[/]"
         
-        yield Static(content)
+        return content
 
 
 class JobListItem(ListItem):
@@ -119,40 +152,44 @@ class JobListItem(ListItem):
 class NotificationBar(Static):
     """Shows status change notifications."""
     
+    MAX_LINES = 3
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._notifications: List[StatusChange] = []
+        # Rendered markup of the shown notifications, newest first; each line is formatted once
+        self._lines: Deque[str] = deque(maxlen=self.MAX_LINES)
     
     def add_notification(self, change: StatusChange):
         """Add a new notification."""
-        self._notifications.insert(0, change)
-        self._notifications = self._notifications[:5]
+        self._lines.appendleft(self._render_line(change))
         self._refresh_display()
     
     def clear(self):
         """Clear all notifications."""
-        self._notifications = []
+        self._lines.clear()
         self._refresh_display()
     
     def _refresh_display(self):
         """Refresh the notification display."""
-        if not self._notifications:
+        if not self._lines:
             self.update("")
             self.display = False
             return
         
         self.display = True
-        lines = []
-        for n in self._notifications[:3]:
-            old_icon, old_color, _ = STATUS_DISPLAY.get(n.old_status, ('?', 'dim', ''))
-            new_icon, new_color, _ = STATUS_DISPLAY.get(n.new_status, ('?', 'dim', ''))
-            time_str = n.timestamp.strftime("%H:%M:%S")
-            lines.append(
-                f"  [dim]{time_str}[/] [bold]{n.exp_name}[/]: "
-                f"[{old_color}]{old_icon}[/] → [{new_color}]{new_icon}[/]"
-            )
-        
-        self.update("\n".join(lines))
+        self.update("\n".join(self._lines))
+    
+    @staticmethod
+    def _render_line(n: StatusChange) -> str:
+        """Markup for one notification line."""
+        get = STATUS_DISPLAY.get
+        old_icon, old_color, _ = get(n.old_status, ('?', 'dim', ''))
+        new_icon, new_color, _ = get(n.new_status, ('?', 'dim', ''))
+        time_str = n.timestamp.strftime("%H:%M:%S")
+        return (
+            f"  [dim]{time_str}[/] [bold]{n.exp_name}[/]: "
+            f"[{old_color}]{old_icon}[/] → [{new_color}]{new_icon}[/]"
+        )
 
 
 class ConfirmDialog(ModalScreen[bool]):
@@ -162,6 +199,11 @@ class ConfirmDialog(ModalScreen[bool]):
         Binding("escape", "cancel", "Cancel"),
     ]
     
+    # Static dialog markup
+    YES_HINT = "\n[bold yellow]Type '[white]yes[/]' to confirm:[/]"
+    WARNING_TEMPLATE = "[bold red]⚠️  WARNING ⚠️[/]\n\n{message}"
+    MISMATCH_TEMPLATE = "[bold red]⚠️  MISMATCH ⚠️[/]\n\n{message}\n\n[red]Please type 'yes' to confirm.[/]"
+    
     def __init__(self, message: str, action_name: str = "Confirm", require_yes: bool = False):
         """
         Initialize confirmation dialog.
@@ -178,9 +220,9 @@ class ConfirmDialog(ModalScreen[bool]):
     
     def compose(self) -> ComposeResult:
         with Container(id="dialog-container"):
-            yield Static(f"[bold red]⚠️  WARNING ⚠️[/]\n\n{self.message}", id="dialog-message")
+            yield Static(self.WARNING_TEMPLATE.format(message=self.message), id="dialog-message")
             if self.require_yes:
-                yield Static(f"\n[bold yellow]Type '[white]yes[/]' to confirm:[/]", id="dialog-hint")
+                yield Static(self.YES_HINT, id="dialog-hint")
                 yield Input(placeholder="Type: yes", id="confirm-input")
             else:
                 yield Static(f"\n[bold]Press [green]Y[/] to {self.action_name}, [red]N/Esc[/] to cancel[/]", id="dialog-hint")
@@ -195,7 +237,7 @@ class ConfirmDialog(ModalScreen[bool]):
             self.dismiss(True)
         else:
             self.query_one("#dialog-message", Static).update(
-                f"[bold red]⚠️  MISMATCH ⚠️[/]\n\n{self.message}\n\n[red]Please type 'yes' to confirm.[/]"
+                self.MISMATCH_TEMPLATE.format(message=self.message)
             )
             event.input.value = ""
     
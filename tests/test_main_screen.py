@@ -0,0 +1,70 @@
+"""
+Smoke test for the main screen, driven with Textual's pilot against stubbed amlt calls.
+"""
+
+import asyncio
+
+import pytest
+
+from fsc import cache
+from fsc.amlt_parser import ExperimentInfo
+from fsc.app import FSCApp
+from fsc.screens import main_screen
+from fsc.widgets import ExperimentListItem
+
+
+def _info(name: str, status: str) -> ExperimentInfo:
+    return ExperimentInfo(
+        name=name, modified="5m ago", status=status, cluster="cluster-a",
+        flags="STD", size="", job_url="", description="",
+    )
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path, monkeypatch):
+    """Keep the caches out of ~/.fsc and amlt out of the test."""
+    for name in ('CACHE_FILE', 'CONFIG_CACHE_FILE', 'DETAIL_CACHE_FILE', 'TAG_CACHE_FILE'):
+        monkeypatch.setattr(cache, name, tmp_path / f"{name.lower()}.json")
+    for name in ('_cache', '_config_cache', '_detail_cache', '_tag_cache'):
+        monkeypatch.setattr(cache, name, None)
+    monkeypatch.setattr(main_screen, 'get_experiment_status_limited', lambda name: None)
+
+
+async def _wait_for_rows(pilot, screen, count: int):
+    for _ in range(100):
+        await pilot.pause(0.05)
+        if len(screen._row_widgets) == count:
+            return
+    raise AssertionError(f"expected {count} rows, got {len(screen._row_widgets)}")
+
+
+def test_main_screen_renders_and_diffs_rows(monkeypatch):
+    rows = [_info("exp-run", "Running (1)"), _info("exp-queue", "Queued (1)")]
+    monkeypatch.setattr(main_screen, 'get_experiments', lambda n_recent=50, since=None: list(rows))
+    
+    async def run():
+        app = FSCApp()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            screen = app.screen
+            assert isinstance(screen, main_screen.MainScreen)
+            
+            await _wait_for_rows(pilot, screen, 2)
+            assert screen._list_order['running'] == ["exp-run"]
+            assert screen._list_order['queued'] == ["exp-queue"]
+            first_row = screen._row_widgets["exp-run"]
+            assert "exp-run" in first_row._content
+            
+            # The queued experiment starts running: its row moves, the other row is reused
+            rows[1] = _info("exp-queue", "Running (1)")
+            screen.action_refresh()
+            for _ in range(100):
+                await pilot.pause(0.05)
+                if not screen._list_order['queued']:
+                    break
+            assert sorted(screen._list_order['running']) == ["exp-queue", "exp-run"]
+            assert screen._row_widgets["exp-run"] is first_row
+            await pilot.pause()
+            assert len(screen.query(ExperimentListItem)) == 2
+    
+    asyncio.run(run())